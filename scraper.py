@@ -14,16 +14,21 @@ import time
 import re
 import json
 import requests
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import pandas as pd
+import lxml.html
+from lxml import etree
 
 # GLVC conference rankings from TFRRS
 from tfrrs_glvc import GLVCRankings, format_gap
@@ -33,6 +38,56 @@ from tfrrs_results import TFRRSResultsScraper, normalize_for_dedup
 from trxc_results import TRXCResultsScraper, discover_uis_meets
 
 
+# ===== Page Parsing Patterns =====
+# Compiled once at import; the athlete-page parsers run these for every table row.
+
+# Shared fragments (bare alternations, wrapped in groups by each pattern below)
+_TIME_ALTERNATIVES = r'\d{1,2}:\d{2}\.\d+|\d+\.\d+'
+_EVENT_UNITS = r'Meters?|Mile|Hurdles?|Relay|Steeplechase|Jump|Put|Throw|Vault'
+_MONTHS = r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+
+_TIME_PATTERN = f'({_TIME_ALTERNATIVES})'
+_EVENT_PATTERN = rf'(\d+(?:,\d+)?\s*(?:{_EVENT_UNITS}))'
+
+_ATHLETE_HREF_RE = re.compile(r'/athlete/(\d+)')
+_TABLE_EVENT_RE = re.compile(r'^\s*' + _EVENT_PATTERN, re.IGNORECASE)
+
+# Results table rows, joined one per line and scanned in a single pass.
+# Each line is either an event header ("5000 Meters") or a result row:
+# "1 18:01.1PR Sep 5 Prairie Stars Invitational"
+# Or: "8 16:27.78PR Apr 17, 2025 Bryan Clay Invitational"
+# [^\S\n] is whitespace that stays within the line.
+_TABLE_ROW_RE = re.compile(
+    r'^(?:'
+    rf'(?P<event>\d+(?:,\d+)?[^\S\n]*(?:{_EVENT_UNITS})).*'
+    r'|.*?'
+    r'(?P<place>\d+)[^\S\n]+'  # Place
+    rf'(?P<time>{_TIME_ALTERNATIVES})'  # Time
+    r'[^\S\n]*(?P<record>PR|SR)?[^\S\n]*'  # Optional PR/SR marker
+    rf'(?P<month>{_MONTHS})[^\S\n]+(?P<day>\d{{1,2}})'  # Date
+    r'(?:,?[^\S\n]*(?P<year>\d{4}))?[^\S\n]+'  # Optional year
+    r'(?P<meet>.+?)(?:[^\S\n]+\d+[^\S\n]+F)?'  # Meet name (may end with division info like "1 F")
+    r')$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Season summary: "2025 Indoor Jr 16:37.46" or "2024 Outdoor So 17:13.53PR"
+_SEASON_TIME_RE = re.compile(r'(\d{4})\s+(Indoor|Outdoor)\s+\w{2}\s+' + _TIME_PATTERN + r'\s*(PR)?')
+
+# Athlete-page table roles, read off each table's text:
+# results tables list dated meets ("Sep 5"), summary tables list seasons ("2025 Indoor").
+_MONTH_DAY_RE = re.compile(rf'({_MONTHS})\s+\d{{1,2}}')
+_SEASON_HEADER_RE = re.compile(r'\d{4}\s+(Indoor|Outdoor)')
+
+# Mark cleanup and event-distance extraction
+_TRAILING_MARKERS_RE = re.compile(r'[PRSRprsr\s\*a-zA-Z]+$')
+_MARK_LETTERS_RE = re.compile(r'[a-zA-Z\s\*]+')
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+_DISTANCE_METERS_RE = re.compile(r'(\d+,?\d*)\s*(?:meters?|m)')
+_DISTANCE_MILES_RE = re.compile(r'(\d+(?:\.\d+)?)\s*miles?')
+_DISTANCE_KM_RE = re.compile(r'(\d+)\s*k\b')
+
+
 # Events that are comparable between indoor and outdoor track
 # Indoor SR should carry over to outdoor for these events
 COMPARABLE_INDOOR_OUTDOOR_EVENTS = {
@@ -172,6 +227,7 @@ def format_standard_time(seconds):
         return f"{seconds:.2f}"
 
 
+@lru_cache(maxsize=4096)
 def time_to_seconds_standalone(time_str):
     """
     Convert time/mark string to numeric value for GLVC ranking comparison.
@@ -181,7 +237,7 @@ def time_to_seconds_standalone(time_str):
         return None
 
     # Clean the string - remove PR/SR markers and trailing letters
-    time_str = re.sub(r'[PRSRprsr\s\*a-zA-Z]+$', '', str(time_str)).strip()
+    time_str = _TRAILING_MARKERS_RE.sub('', str(time_str)).strip()
     time_str = time_str.rstrip('am')  # Remove trailing 'a' or 'm' (altitude, meters)
 
     try:
@@ -199,6 +255,111 @@ def time_to_seconds_standalone(time_str):
         return None
 
 
+# PR/SR markers, '*' flags and whitespace stripped before parsing a time
+_TIME_MARKERS = str.maketrans('', '', 'PRSprs* \t\n\r\f\v')
+
+
+@lru_cache(maxsize=4096)
+def _time_to_seconds(time_str):
+    """
+    Convert 'SS.ss', 'MM:SS.ss' or 'H:MM:SS.ss' to seconds (inf if unparseable).
+    Cached because the same times recur across results, bests and sorting.
+    """
+    if not time_str:
+        return float('inf')
+
+    # Remove PR/SR markers
+    parts = time_str.translate(_TIME_MARKERS).split(':')
+
+    try:
+        if len(parts) == 1:
+            # Handle SS.ss format (sprints)
+            return float(parts[0])
+        if len(parts) == 2:
+            return int(parts[0]) * 60 + float(parts[1])
+        if len(parts) == 3:
+            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+    except ValueError:
+        pass
+
+    return float('inf')
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(date_str, fallback_year):
+    """
+    Parse 'Apr 17, 2025' / 'April 17, 2025', or 'Sep 5' using fallback_year.
+    Returns None if no format matches. Cached since strptime is slow and dates repeat.
+    """
+    # Try full date format first (Apr 17, 2025)
+    for fmt in ("%b %d, %Y", "%B %d, %Y"):
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            pass
+
+    # Try short format with assumed year
+    date_with_year = f"{date_str}, {fallback_year}"
+    for fmt in ("%b %d, %Y", "%B %d, %Y"):
+        try:
+            return datetime.strptime(date_with_year, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+def _valid_ratio(prev, cur):
+    """
+    True if a previous best is within 2x of the current mark (0.5 < prev/cur < 2.0).
+    Written without division; an inf on either side fails the bounds naturally.
+    """
+    return 0.5 * cur < prev < 2.0 * cur
+
+
+def _strip_initials(name):
+    """
+    Remove 2-3 leading initials stuck to a name.
+    "KHKhaniya" -> "Khaniya", "EMElijah" -> "Elijah"
+    """
+    for n in (3, 2):
+        # n initials, then the name's own capital, then a lowercase letter
+        head = name[:n + 1]
+        if (len(name) > n + 1 and head.isascii() and head.isalpha() and head.isupper()
+                and 'a' <= name[n + 1] <= 'z'):
+            return name[n:]
+    return name
+
+
+# ===== Result Ordering =====
+# Results are listed PRs -> SRs -> FTs -> other results -> DNS/DNF.
+
+GROUP_PR, GROUP_SR, GROUP_FT, GROUP_OTHER, GROUP_DNS_DNF = range(5)
+_RECORD_TYPE_GROUPS = {'PR': GROUP_PR, 'SR': GROUP_SR, 'FT': GROUP_FT}
+
+
+def _result_group(r):
+    """Return the display group a result belongs to."""
+    group = _RECORD_TYPE_GROUPS.get(r.get('record_type'))
+    if group is not None:
+        return group
+    if r.get('time', '').upper() in ('DNS', 'DNF'):
+        return GROUP_DNS_DNF
+    return GROUP_OTHER
+
+
+def _result_sort_key(r):
+    """
+    Composite sort key so all results can be ordered with a single sort.
+    PRs and SRs sort by improvement (highest first), everything else by name.
+    """
+    group = _result_group(r)
+    if group == GROUP_PR:
+        return (group, -r.get('pr_improvement', 0))
+    if group == GROUP_SR:
+        return (group, -r.get('sr_improvement', 0))
+    return (group, r.get('athlete_name', ''))
+
+
 # ===== Athlete History Tracking =====
 # Maintains a persistent record of all results across scraper runs.
 # Used to compute PR/SR/FT for sources that don't provide this data (TRXC, TFRRS).
@@ -206,6 +367,7 @@ def time_to_seconds_standalone(time_str):
 HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'athlete_history.json')
 
 
+@lru_cache(maxsize=4096)
 def _get_season_key(sport, date_str):
     """
     Return a season key like 'outdoor_2025' for grouping season records.
@@ -304,16 +466,10 @@ def enrich_from_history(results, history):
         if not all_times:
             continue
 
-        # Sort: best first
-        if is_field:
-            all_times.sort(key=lambda x: x[0], reverse=True)
-            season_times.sort(key=lambda x: x[0], reverse=True)
-        else:
-            all_times.sort(key=lambda x: x[0])
-            season_times.sort(key=lambda x: x[0])
-
-        best_pr_seconds, best_pr_str, best_pr_date = all_times[0]
-        best_sr_seconds, best_sr_str, best_sr_date = (season_times[0] if season_times else (None, None, None))
+        # Only the best mark matters - pick it without sorting
+        best = max if is_field else min
+        best_pr_seconds, best_pr_str, best_pr_date = best(all_times, key=itemgetter(0))
+        best_sr_seconds, best_sr_str, best_sr_date = (best(season_times, key=itemgetter(0)) if season_times else (None, None, None))
 
         # Determine record type
         if is_field:
@@ -355,9 +511,20 @@ def enrich_from_history(results, history):
                     r['sr_improvement'] = ((best_sr_seconds - current_seconds) / best_sr_seconds) * 100
 
 
+def _history_keys(event_entries):
+    """Index history entries by (time, date, meet) and (source, time) for dupe checks."""
+    keys = set()
+    for e in event_entries:
+        keys.add((e.get('time'), e.get('date'), e.get('meet')))
+        keys.add((e.get('source'), e.get('time')))
+    return keys
+
+
 def update_athlete_history(history, results):
     """Add current results to athlete history, avoiding duplicates."""
     athletes = history.setdefault('athletes', {})
+    # Dupe-check indexes per (athlete, event), built on first touch
+    seen = {}
 
     for r in results:
         time_str = r.get('time', '')
@@ -372,17 +539,18 @@ def update_athlete_history(history, results):
         event = r['event']
 
         event_entries = athletes.setdefault(athlete, {}).setdefault(event, [])
+        keys = seen.get((athlete, event))
+        if keys is None:
+            keys = seen[(athlete, event)] = _history_keys(event_entries)
 
-        # Check for duplicate (same time, date, meet)
-        is_dupe = any(
-            e.get('time') == time_str and
-            e.get('date') == r.get('date_str') and
-            e.get('meet') == r.get('meet_name')
-            for e in event_entries
-        )
+        def add_entry(entry):
+            event_entries.append(entry)
+            keys.add((entry['time'], entry['date'], entry['meet']))
+            keys.add((entry['source'], entry['time']))
 
-        if not is_dupe:
-            event_entries.append({
+        # Check for duplicate (same time, date, meet)
+        if (time_str, r.get('date_str'), r.get('meet_name')) not in keys:
+            add_entry({
                 'time': time_str,
                 'time_seconds': time_seconds,
                 'date': r.get('date_str', ''),
@@ -397,41 +565,300 @@ def update_athlete_history(history, results):
         prev_pr = r.get('previous_pr')
         if prev_pr and r.get('source') == 'athletic.net':
             pr_seconds = time_to_seconds_standalone(prev_pr)
-            if pr_seconds is not None:
-                pr_dupe = any(
-                    e.get('time') == prev_pr and e.get('source') == 'athletic.net_pr'
-                    for e in event_entries
-                )
-                if not pr_dupe:
-                    event_entries.append({
-                        'time': prev_pr,
-                        'time_seconds': pr_seconds,
-                        'date': '',
-                        'meet': 'Athletic.net PR',
-                        'sport': r.get('sport', ''),
-                        'source': 'athletic.net_pr',
-                        'place': '',
-                    })
+            if pr_seconds is not None and ('athletic.net_pr', prev_pr) not in keys:
+                add_entry({
+                    'time': prev_pr,
+                    'time_seconds': pr_seconds,
+                    'date': '',
+                    'meet': 'Athletic.net PR',
+                    'sport': r.get('sport', ''),
+                    'source': 'athletic.net_pr',
+                    'place': '',
+                })
 
         # Store Athletic.net previous_sr as a synthetic history entry
         prev_sr = r.get('previous_sr')
         if prev_sr and r.get('source') == 'athletic.net':
             sr_seconds = time_to_seconds_standalone(prev_sr)
-            if sr_seconds is not None:
-                sr_dupe = any(
-                    e.get('time') == prev_sr and e.get('source') == 'athletic.net_sr'
-                    for e in event_entries
-                )
-                if not sr_dupe:
-                    event_entries.append({
-                        'time': prev_sr,
-                        'time_seconds': sr_seconds,
-                        'date': '',
-                        'meet': 'Athletic.net SR',
-                        'sport': r.get('sport', ''),
-                        'source': 'athletic.net_sr',
-                        'place': '',
-                    })
+            if sr_seconds is not None and ('athletic.net_sr', prev_sr) not in keys:
+                add_entry({
+                    'time': prev_sr,
+                    'time_seconds': sr_seconds,
+                    'date': '',
+                    'meet': 'Athletic.net SR',
+                    'sport': r.get('sport', ''),
+                    'source': 'athletic.net_sr',
+                    'place': '',
+                })
+
+
+# ===== ChromeDriver Resolution =====
+# ChromeDriverManager().install() checks the network on every call.
+# The resolved path is cached locally and only re-resolved once it goes stale.
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.uisResults')
+DRIVER_PATH_FILE = os.path.join(CACHE_DIR, 'driver_path.txt')
+DRIVER_PATH_TTL = timedelta(days=30)
+
+
+def load_cached_driver_path():
+    """Return the cached ChromeDriver path, or None if missing or stale."""
+    try:
+        age = time.time() - os.path.getmtime(DRIVER_PATH_FILE)
+        with open(DRIVER_PATH_FILE, 'r') as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+
+    if age > DRIVER_PATH_TTL.total_seconds() or not os.path.exists(path):
+        return None
+    return path
+
+
+def save_driver_path(path):
+    """Cache the resolved ChromeDriver path for later runs."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DRIVER_PATH_FILE, 'w') as f:
+            f.write(path)
+    except OSError as e:
+        print(f"  Warning: Could not cache ChromeDriver path: {e}")
+
+
+def get_chromedriver_path(refresh=False):
+    """
+    Resolve the ChromeDriver path, hitting the network only when the cache is stale.
+    With refresh, drop the cached path and resolve again.
+    """
+    if refresh:
+        try:
+            os.remove(DRIVER_PATH_FILE)
+        except OSError:
+            pass
+
+    path = None if refresh else load_cached_driver_path()
+    if not path:
+        path = ChromeDriverManager().install()
+        save_driver_path(path)
+    return path
+
+
+def start_chrome(options, driver_path=None):
+    """
+    Start a Chrome session with the (cached) ChromeDriver.
+    Chrome auto-updates can leave the cached driver behind the browser, which
+    makes session creation fail; in that case the driver is re-resolved and
+    the start retried once.
+    Returns (driver, driver_path).
+    """
+    driver_path = driver_path or get_chromedriver_path()
+    try:
+        return webdriver.Chrome(service=Service(driver_path), options=options), driver_path
+    except SessionNotCreatedException:
+        print("  Cached ChromeDriver could not start a session, re-resolving driver...")
+        driver_path = get_chromedriver_path(refresh=True)
+        return webdriver.Chrome(service=Service(driver_path), options=options), driver_path
+
+
+# ===== HTTP Page Cache =====
+# Athlete pages only change a few times a week, but the scraper is often
+# rerun several times a day. Fetched pages are kept on disk for a few hours.
+
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, 'http_cache')
+HTTP_CACHE_TTL = timedelta(hours=6)
+
+
+def _http_cache_path(url):
+    """Cache file for a URL."""
+    import hashlib
+    return os.path.join(HTTP_CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html')
+
+
+def load_cached_page(url):
+    """Return the cached HTML for url, or None if missing or stale."""
+    path = _http_cache_path(url)
+    try:
+        age = time.time() - os.path.getmtime(path)
+        if age > HTTP_CACHE_TTL.total_seconds():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def save_cached_page(url, html):
+    """Write a fetched page to the cache (atomically, so readers never see partial files)."""
+    import tempfile
+    try:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=HTTP_CACHE_DIR, suffix='.part')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(tmp_path, _http_cache_path(url))
+    except OSError:
+        pass
+
+
+# ===== Chrome Session =====
+# main() can keep one headless Chrome alive between runs and attach to it
+# over the DevTools port, skipping browser cold start on later invocations.
+
+CHROME_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+CHROME_DEBUG_PORT = 9222
+CHROME_PID_FILE = '/tmp/uisResults_chrome.pid'
+CHROME_BINARIES = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+
+def build_chrome_options(debugger_address=None):
+    """
+    Build the Chrome options used by main().
+    With debugger_address, attach to an already running Chrome instead of launching one.
+    """
+    options = Options()
+    if debugger_address:
+        options.debugger_address = debugger_address
+    else:
+        # Use new headless mode - more compatible with modern sites like Angular
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--crash-dumps-dir=/tmp")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument(f"user-agent={CHROME_USER_AGENT}")
+
+    # Enable performance logging to capture API tokens
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+# DOM predicates for explicit waits instead of fixed sleeps
+ATHLETE_LINK = (By.CSS_SELECTOR, "a[href*='/athlete/']")
+RESULTS_TABLE = (By.TAG_NAME, "table")
+
+
+def wait_for_element(driver, locator, timeout):
+    """
+    Wait until an element matching locator is present, up to timeout seconds.
+    Returns False on timeout instead of raising - callers continue either way.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+        return True
+    except TimeoutException:
+        return False
+
+
+# Resources the scraper never reads; blocking them shortens every page load
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp',
+    '*.woff', '*.woff2', '*.ttf', '*.css',
+    '*analytics*', '*gtag*', '*doubleclick*',
+]
+
+
+def block_heavy_resources(driver):
+    """
+    Tell Chrome (via CDP) not to download images, fonts, stylesheets or trackers.
+    Applies only to the current tab; call again after switching to a new one.
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"  Warning: Could not block page resources: {e}")
+
+
+def _pid_alive(pid):
+    """Check whether a process with this PID is still running."""
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _devtools_port_open(timeout):
+    """Wait up to timeout seconds for the DevTools port to accept connections."""
+    import socket
+
+    deadline = time.time() + timeout
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', CHROME_DEBUG_PORT), timeout=0.1).close()
+            return True
+        except OSError:
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.1)
+
+
+def ensure_persistent_chrome():
+    """
+    Make sure a headless Chrome with remote debugging is running.
+    Reuses the instance recorded in CHROME_PID_FILE if it is still alive and
+    its DevTools port answers, otherwise launches a new one.
+    Returns (debugger_address, reused). Raises RuntimeError if a newly
+    launched Chrome never opens the port.
+    """
+    import shutil
+    import subprocess
+
+    debugger_address = f"127.0.0.1:{CHROME_DEBUG_PORT}"
+
+    # A live PID alone isn't enough: it may have been reused by another
+    # process, or Chrome may be up without its debugging port
+    try:
+        with open(CHROME_PID_FILE, 'r') as f:
+            if _pid_alive(int(f.read().strip())) and _devtools_port_open(timeout=1):
+                return debugger_address, True
+    except (OSError, ValueError):
+        pass
+
+    binary = os.environ.get('CHROME_BINARY') or next(
+        (b for b in CHROME_BINARIES if shutil.which(b)), None)
+    if not binary:
+        raise RuntimeError("Could not find a Chrome executable (set CHROME_BINARY)")
+
+    process = subprocess.Popen(
+        [
+            binary,
+            "--headless=new",
+            f"--remote-debugging-port={CHROME_DEBUG_PORT}",
+            f"--user-data-dir={os.path.join(CACHE_DIR, 'chrome-profile')}",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--disable-extensions",
+            "--window-size=1920,1080",
+            f"--user-agent={CHROME_USER_AGENT}",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,  # Keep Chrome alive after this run exits
+    )
+    with open(CHROME_PID_FILE, 'w') as f:
+        f.write(str(process.pid))
+
+    # Wait for the DevTools port to accept connections (max 10 seconds)
+    if not _devtools_port_open(timeout=10):
+        process.terminate()
+        try:
+            os.remove(CHROME_PID_FILE)
+        except OSError:
+            pass
+        raise RuntimeError(f"Chrome did not open its DevTools port ({debugger_address}) within 10 seconds")
+
+    return debugger_address, False
 
 
 class AthleticNetAPI:
@@ -575,6 +1002,7 @@ class AthleticNetAPI:
                     'event': event,
                     'place': place,
                     'time': time_str,
+                    'time_seconds': self._time_to_seconds(time_str),
                     'record_type': record_type,
                     'date': result_date,
                     'date_str': result_date.strftime("%b %d, %Y"),
@@ -617,22 +1045,7 @@ class AthleticNetAPI:
 
     def _time_to_seconds(self, time_str):
         """Convert time string to seconds."""
-        if not time_str:
-            return float('inf')
-
-        time_str = re.sub(r'[PRSRprsr\s\*]+', '', time_str).strip()
-
-        try:
-            if ':' in time_str:
-                parts = time_str.split(':')
-                if len(parts) == 2:
-                    return int(parts[0]) * 60 + float(parts[1])
-                elif len(parts) == 3:
-                    return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-            else:
-                return float(time_str)
-        except (ValueError, IndexError):
-            return float('inf')
+        return _time_to_seconds(time_str)
 
     # ===== NEW MEET-BASED APPROACH (MUCH FASTER) =====
 
@@ -783,7 +1196,8 @@ class AthleticNetAPI:
             # The anettokens JWT contains the meetId and is required for GetResultsData3
             try:
                 driver.get(meet_url)
-                time.sleep(2)  # Wait for page and API calls
+                # Athlete links render once the page's API calls have returned
+                wait_for_element(driver, ATHLETE_LINK, 5)
 
                 # Capture fresh tokens for this meet
                 logs = driver.get_log('performance')
@@ -882,7 +1296,7 @@ class AthleticNetAPI:
             sport_path = 'cross-country' if sport == 'xc' else 'track-and-field'
             team_url = f"https://www.athletic.net/team/65580/{sport_path}/{datetime.now().year}"
             driver.get(team_url)
-            time.sleep(2)
+            wait_for_element(driver, ATHLETE_LINK, 5)
             logs = driver.get_log('performance')
             for log in logs:
                 try:
@@ -1009,7 +1423,7 @@ class AthleticNetAPI:
                     if not time_str:
                         return float('inf')
                     # Remove suffixes like 'a', 'h', etc.
-                    time_str = re.sub(r'[a-zA-Z\s\*]+', '', str(time_str)).strip()
+                    time_str = _MARK_LETTERS_RE.sub('', str(time_str)).strip()
                     try:
                         if ':' in time_str:
                             parts = time_str.split(':')
@@ -1107,7 +1521,7 @@ class AthleticNetAPI:
                         # Field events: result is in meters, higher is better
                         # Parse the result as a distance
                         try:
-                            result_distance = float(re.sub(r'[^\d.]', '', current_result.replace('m', '')))
+                            result_distance = float(_NON_NUMERIC_RE.sub('', current_result.replace('m', '')))
                             ncaa_diff = result_distance - ncaa_standard  # Positive = over standard
                             if ncaa_standard > 0:
                                 ncaa_diff_pct = (ncaa_diff / ncaa_standard) * 100
@@ -1260,20 +1674,20 @@ class AthleticNetAPI:
                     event_lower = event.lower()
 
                     # Try meters first (e.g., "8,000 Meters" -> 8000)
-                    distance_match = re.search(r'(\d+,?\d*)\s*(?:meters?|m)', event_lower)
+                    distance_match = _DISTANCE_METERS_RE.search(event_lower)
                     if distance_match:
                         target_distance = int(distance_match.group(1).replace(',', ''))
 
                     # Try miles (e.g., "3 Miles" -> ~4828 meters)
                     if not target_distance:
-                        miles_match = re.search(r'(\d+(?:\.\d+)?)\s*miles?', event_lower)
+                        miles_match = _DISTANCE_MILES_RE.search(event_lower)
                         if miles_match:
                             miles = float(miles_match.group(1))
                             target_distance = int(miles * 1609.34)
 
                     # Try kilometer (e.g., "5K" -> 5000)
                     if not target_distance:
-                        km_match = re.search(r'(\d+)\s*k\b', event_lower)
+                        km_match = _DISTANCE_KM_RE.search(event_lower)
                         if km_match:
                             target_distance = int(km_match.group(1)) * 1000
 
@@ -1306,12 +1720,30 @@ class AthleticNetAPI:
                 continue
 
 
+def _is_rate_limited(html):
+    """Whether athletic.net served its throttling page instead of content."""
+    html_lower = html.lower()
+    return "rate limit" in html_lower or "too many requests" in html_lower
+
+
+def _athlete_page_found(parsed):
+    """Whether a parsed (results, bests) athlete page yielded any results or season bests."""
+    results, bests = parsed
+    return bool(results or bests)
+
+
 class AthleticNetScraper:
     """Scraper for athletic.net team results."""
 
     TEAM_ID = 65580
     BASE_URL = "https://www.athletic.net"
 
+    # Upper bound on simultaneously open tabs in one Chrome process
+    MAX_PARALLEL_TABS = 16
+
+    # Concurrent HTTP fetches of athlete pages
+    HTTP_WORKERS = 8
+
     # Sport configurations
     SPORTS = {
         'xc': {
@@ -1331,17 +1763,17 @@ class AthleticNetScraper:
         }
     }
 
-    def __init__(self, headless=True, year=2025, sport='xc', days_back=5):
-        """Initialize the scraper with Chrome webdriver."""
-        self.year = year
-        self.sport = sport
-        self.days_back = days_back
-
-        if sport not in self.SPORTS:
-            raise ValueError(f"Invalid sport: {sport}. Choose from: {', '.join(self.SPORTS.keys())}")
-
-        self.sport_config = self.SPORTS[sport]
-        self.team_url = f"{self.BASE_URL}/team/{self.TEAM_ID}/{self.sport_config['url_path']}/{year}"
+    def __init__(self, headless=True, year=2025, sport='xc', days_back=5, driver=None, use_cache=True,
+                 driver_path=None):
+        """
+        Initialize the scraper with Chrome webdriver.
+        Pass an existing driver to share one browser session across scrapers,
+        or an already resolved driver_path so start_browser() skips the lookup.
+        With use_cache, fetched pages are reused from disk for HTTP_CACHE_TTL.
+        """
+        self.reconfigure(sport, year, days_back)
+        self.use_cache = use_cache
+        self.driver_path = driver_path
 
         self.options = Options()
         if headless:
@@ -1351,44 +1783,101 @@ class AthleticNetScraper:
         self.options.add_argument("--window-size=1920,1080")
         self.options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
 
-        self.driver = None
+        self.driver = driver
+
+        # Pooled keep-alive HTTP client; pages are fetched directly and the
+        # browser is only started if a response lacks the expected markup
+        self.http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.HTTP_WORKERS)
+        self.http.mount('https://', adapter)
+        self.http.headers.update({'User-Agent': CHROME_USER_AGENT})
+
+    def reconfigure(self, sport, year, days_back):
+        """Point the scraper at another sport/year without restarting the browser."""
+        if sport not in self.SPORTS:
+            raise ValueError(f"Invalid sport: {sport}. Choose from: {', '.join(self.SPORTS.keys())}")
+
+        self.year = year
+        self.sport = sport
+        self.days_back = days_back
+
+        self.sport_config = self.SPORTS[sport]
+        self.team_url = f"{self.BASE_URL}/team/{self.TEAM_ID}/{self.sport_config['url_path']}/{year}"
         self.cutoff_date = datetime.now() - timedelta(days=days_back)
 
     def start_browser(self):
         """Start the Chrome browser."""
         print("Starting browser...")
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=self.options)
+        self.driver, self.driver_path = start_chrome(self.options, self.driver_path)
+        block_heavy_resources(self.driver)
 
     def close_browser(self):
         """Close the browser."""
         if self.driver:
             self.driver.quit()
 
+    def _fetch(self, url):
+        """Fetch a page over the pooled HTTP session (or the disk cache). Returns HTML text or None."""
+        if self.use_cache:
+            html = load_cached_page(url)
+            if html is not None:
+                return html
+
+        try:
+            resp = self.http.get(url, timeout=10)
+            # A throttled response is neither returned nor cached as the page
+            if resp.status_code == 200 and not _is_rate_limited(resp.text):
+                if self.use_cache:
+                    save_cached_page(url, resp.text)
+                return resp.text
+        except requests.RequestException:
+            pass
+        return None
+
+    def _load_page(self, url, parse, is_valid, locator, timeout):
+        """
+        Get a page and return parse(html), preferring a plain HTTP fetch.
+        Falls back to rendering in Chrome (started on demand) when
+        is_valid(parsed) is false for the fetched page - e.g. an unrendered
+        app shell - waiting up to timeout seconds for locator to appear.
+        """
+        html = self._fetch(url)
+        if html:
+            parsed = parse(html)
+            if is_valid(parsed):
+                return parsed
+        return parse(self._render_page(url, locator, timeout))
+
+    def _render_page(self, url, locator, timeout):
+        """Load url in Chrome (started on demand), waiting up to timeout seconds for locator."""
+        if self.driver is None:
+            self.start_browser()
+        self.driver.get(url)
+        wait_for_element(self.driver, locator, timeout)  # Continue anyway - page might be empty
+        return self.driver.page_source
+
     def get_roster(self):
         """Get the team roster with athlete IDs."""
         print(f"Fetching roster from: {self.team_url}")
-        self.driver.get(self.team_url)
+        # Render in Chrome if the plain response has no athlete links
+        athletes = self._load_page(self.team_url, self._parse_roster, bool, ATHLETE_LINK, 5)
 
-        # Wait for athlete links to appear (max 5 seconds)
-        try:
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/athlete/']"))
-            )
-        except:
-            pass  # Continue anyway - page might have no athletes
+        print(f"Found {len(athletes)} athletes on roster")
+        return athletes
 
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+    def _parse_roster(self, html):
+        """Extract [{'id', 'name'}] for each distinct athlete link on a team page."""
+        soup = BeautifulSoup(html, 'lxml')
 
         athletes = []
         seen_ids = set()
 
         # Find all athlete links
-        athlete_links = soup.find_all('a', href=re.compile(r'/athlete/\d+'))
+        athlete_links = soup.find_all('a', href=_ATHLETE_HREF_RE)
 
         for link in athlete_links:
             href = link.get('href', '')
-            athlete_id_match = re.search(r'/athlete/(\d+)', href)
+            athlete_id_match = _ATHLETE_HREF_RE.search(href)
             if athlete_id_match:
                 athlete_id = athlete_id_match.group(1)
                 if athlete_id not in seen_ids:
@@ -1396,96 +1885,42 @@ class AthleticNetScraper:
                     name = link.get_text(strip=True)
                     if name:  # Only add if we have a name
                         # Clean up name - remove leading initials stuck to the name
-                        # Pattern: "KHKhaniya" -> "Khaniya", "EMElijah" -> "Elijah"
-                        cleaned_name = re.sub(r'^[A-Z]{2,3}(?=[A-Z][a-z])', '', name)
+                        cleaned_name = _strip_initials(name)
                         athletes.append({
                             'id': athlete_id,
                             'name': cleaned_name
                         })
 
-        print(f"Found {len(athletes)} athletes on roster")
         return athletes
 
     def parse_date(self, date_str):
         """Parse date string like 'Sep 5', 'Sep 27', or 'Apr 17, 2025' into datetime."""
-        # Try full date format first (Apr 17, 2025)
-        try:
-            return datetime.strptime(date_str, "%b %d, %Y")
-        except ValueError:
-            pass
-
-        try:
-            return datetime.strptime(date_str, "%B %d, %Y")
-        except ValueError:
-            pass
-
-        # Try short format with assumed year
-        try:
-            date_with_year = f"{date_str}, {self.year}"
-            return datetime.strptime(date_with_year, "%b %d, %Y")
-        except ValueError:
-            pass
-
-        try:
-            date_with_year = f"{date_str}, {self.year}"
-            return datetime.strptime(date_with_year, "%B %d, %Y")
-        except ValueError:
-            return None
+        return _parse_date(date_str, self.year)
 
     def time_to_seconds(self, time_str):
         """Convert time string to seconds for comparison."""
-        if not time_str:
-            return float('inf')
-
-        # Remove PR/SR markers
-        time_str = re.sub(r'[PRSRprsr\s\*]+', '', time_str).strip()
-
-        try:
-            # Handle MM:SS.ss format
-            if ':' in time_str:
-                parts = time_str.split(':')
-                if len(parts) == 2:
-                    minutes = int(parts[0])
-                    seconds = float(parts[1])
-                    return minutes * 60 + seconds
-                elif len(parts) == 3:
-                    hours = int(parts[0])
-                    minutes = int(parts[1])
-                    seconds = float(parts[2])
-                    return hours * 3600 + minutes * 60 + seconds
-            else:
-                # Handle SS.ss format (sprints)
-                return float(time_str)
-        except (ValueError, IndexError):
-            return float('inf')
-
-        return float('inf')
+        return _time_to_seconds(time_str)
 
     def get_athlete_results_and_bests(self, athlete_id, athlete_name):
         """Get an athlete's recent results and their best times from their profile."""
         athlete_url = f"{self.BASE_URL}/athlete/{athlete_id}/{self.sport_config['athlete_path']}"
-        self.driver.get(athlete_url)
-
-        # Wait for tables to load (max 3 seconds)
-        try:
-            WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
-        except:
-            pass  # Continue anyway - might have no results
-
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-
-        return self._parse_athlete_page(soup, athlete_id, athlete_name)
+        return self._load_page(
+            athlete_url,
+            lambda html: self._parse_athlete_page(html, athlete_id, athlete_name),
+            _athlete_page_found, RESULTS_TABLE, 3
+        )
 
     def get_athletes_parallel(self, athletes, num_tabs=3):
         """
         Check multiple athletes in parallel using browser tabs.
+        num_tabs is clamped to MAX_PARALLEL_TABS.
         Returns list of (athlete, results, bests) tuples.
         """
         if not athletes:
             return []
 
+        num_tabs = max(1, min(num_tabs, self.MAX_PARALLEL_TABS))
+
         all_data = []
         original_handle = self.driver.current_window_handle
 
@@ -1505,38 +1940,29 @@ class AthleticNetScraper:
                     self.driver.get(url)
                     handles.append(self.driver.current_window_handle)
                 else:
-                    # Open new tab for subsequent athletes
+                    # Open new tab for subsequent athletes (resource blocking is per tab)
                     self.driver.execute_script("window.open('');")
                     self.driver.switch_to.window(self.driver.window_handles[-1])
+                    block_heavy_resources(self.driver)
                     self.driver.get(url)
                     handles.append(self.driver.current_window_handle)
 
-            # Wait a moment for pages to load
-            time.sleep(1.5)
-
-            # Collect results from each tab
+            # Collect results from each tab as soon as its tables render
+            # (the other tabs keep loading in the background meanwhile)
             for i, (athlete, handle) in enumerate(zip(batch, handles)):
                 self.driver.switch_to.window(handle)
-
-                # Quick wait for content
-                try:
-                    WebDriverWait(self.driver, 2).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "table"))
-                    )
-                except:
-                    pass
+                wait_for_element(self.driver, RESULTS_TABLE, 4)
 
                 # Check for rate limiting (page shows error or unusual content)
                 page_source = self.driver.page_source
-                if "rate limit" in page_source.lower() or "too many requests" in page_source.lower():
+                if _is_rate_limited(page_source):
                     print("\n  [!] Rate limited - waiting 30 seconds...")
                     time.sleep(30)
                     self.driver.get(athlete_urls[i])
-                    time.sleep(2)
+                    wait_for_element(self.driver, RESULTS_TABLE, 4)
                     page_source = self.driver.page_source
 
-                soup = BeautifulSoup(page_source, 'html.parser')
-                results, bests = self._parse_athlete_page(soup, athlete['id'], athlete['name'])
+                results, bests = self._parse_athlete_page(page_source, athlete['id'], athlete['name'])
                 all_data.append((athlete, results, bests))
 
             # Close extra tabs (keep only the first one)
@@ -1558,199 +1984,209 @@ class AthleticNetScraper:
 
         return all_data
 
-    def _parse_athlete_page(self, soup, athlete_id, athlete_name):
-        """Parse an athlete's page HTML and extract results and bests."""
-
-        results = []
-        bests = {}  # {event: {'pr': time, 'sr': time, 'pr_seconds': float, 'sr_seconds': float}}
-
-        # Find all tables - results are typically in tables
-        tables = soup.find_all('table')
-
-        # We need to find the table with the current season's results
-        # It will have dates in format "Sep 5" and times
-        for table in tables:
-            table_text = table.get_text()
-
-            # Check if this table has recent dates (month names)
-            if not re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', table_text):
-                continue
-
-            # Parse table rows
-            rows = table.find_all('tr')
-            current_event = None
+    def get_athletes_concurrent(self, athletes, num_tabs=3):
+        """
+        Check multiple athletes, fetching their pages concurrently over HTTP.
+        Pages that parse to no results or season bests (unrendered shells,
+        throttled responses) are loaded in browser tabs afterwards.
+        Returns list of (athlete, results, bests) tuples in input order.
+        """
+        from concurrent.futures import ThreadPoolExecutor
 
-            for row in rows:
-                row_text = row.get_text(separator=' ', strip=True)
+        if not athletes:
+            return []
 
-                # Check if this row defines an event (e.g., "5000 Meters", "800 Meters")
-                event_match = re.match(r'^(\d+(?:,\d+)?\s*(?:Meters?|Mile|Hurdles?|Relay|Steeplechase|Jump|Put|Throw|Vault))', row_text, re.IGNORECASE)
-                if event_match:
-                    current_event = event_match.group(1).strip()
+        urls = [f"{self.BASE_URL}/athlete/{a['id']}/{self.sport_config['athlete_path']}" for a in athletes]
+        with ThreadPoolExecutor(max_workers=self.HTTP_WORKERS) as ex:
+            pages = list(ex.map(self._fetch, urls))
+
+        all_data = [None] * len(athletes)
+        misses = []
+        for i, (athlete, html) in enumerate(zip(athletes, pages)):
+            if html:
+                parsed = self._parse_athlete_page(html, athlete['id'], athlete['name'])
+                if _athlete_page_found(parsed):
+                    all_data[i] = (athlete, *parsed)
                     continue
+            misses.append(i)
 
-                # Look for result data: place, time, date, meet name
-                # Pattern: "1 18:01.1PR Sep 5 Prairie Stars Invitational"
-                # Or: "8 16:27.78PR Apr 17, 2025 Bryan Clay Invitational"
-                result_pattern = re.compile(
-                    r'(\d+)\s+'  # Place
-                    r'(\d{1,2}:\d{2}\.\d+|\d+\.\d+)'  # Time
-                    r'\s*(PR|SR)?\s*'  # Optional PR/SR marker
-                    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:,?\s*(\d{4}))?\s+'  # Date with optional year
-                    r'(.+?)(?:\s+\d+\s+F)?$',  # Meet name (may end with division info like "1 F")
-                    re.IGNORECASE
-                )
-
-                match = result_pattern.search(row_text)
-                if match and current_event:
-                    place = int(match.group(1))
-                    time_str = match.group(2)
-                    record_type = match.group(3).upper() if match.group(3) else None
-                    month = match.group(4)
-                    day = match.group(5)
-                    year = match.group(6) if match.group(6) else str(self.year)
-                    meet_name = match.group(7).strip()
-
-                    # Parse the date
-                    date_str = f"{month} {day}, {year}"
-                    result_date = self.parse_date(date_str)
-
-                    if result_date and result_date >= self.cutoff_date:
-                        results.append({
-                            'athlete_name': athlete_name,
-                            'athlete_id': athlete_id,
-                            'event': current_event,
-                            'place': place,
-                            'time': time_str,
-                            'record_type': record_type,  # 'PR', 'SR', or None
-                            'date': result_date,
-                            'date_str': date_str,
-                            'meet_name': meet_name
-                        })
-
-        # Now extract PR/SR bests from the page
-        # Look for summary tables that show season/career bests
-        # Format: "5000 Meters 2023 Indoor Fr 18:48.71 2024 Outdoor So 17:13.53 * 2025 Indoor Jr 16:37.46 *"
-        for table in tables:
-            table_text = table.get_text()
+        # Render the rest in Chrome
+        if misses:
+            if self.driver is None:
+                self.start_browser()
+            rendered = self.get_athletes_parallel([athletes[i] for i in misses], num_tabs=num_tabs)
+            for i, entry in zip(misses, rendered):
+                all_data[i] = entry
 
-            # Try to extract event name at start of table
-            event_match = re.match(r'^\s*(\d+(?:,\d+)?\s*(?:Meters?|Mile|Hurdles?|Relay|Steeplechase|Jump|Put|Throw|Vault))', table_text, re.IGNORECASE)
-            if not event_match:
-                continue
+        return all_data
 
-            event = event_match.group(1).strip()
+    def _parse_athlete_page(self, html, athlete_id, athlete_name):
+        """Parse an athlete's page HTML and extract results and bests."""
 
-            # Check if this is a summary table (has year + Indoor/Outdoor patterns)
-            if not re.search(r'\d{4}\s+(?:Indoor|Outdoor)', table_text):
-                continue
+        results = []
+        bests = {}  # {event: {'pr': time, 'sr': time, 'pr_seconds': float, 'sr_seconds': float}}
 
-            # Find all times with context (year, sport type)
-            # Pattern: "2025 Indoor Jr 16:37.46" or "2024 Outdoor So 17:13.53PR"
-            time_entries = re.findall(
-                r'(\d{4})\s+(Indoor|Outdoor)\s+\w{2}\s+(\d{1,2}:\d{2}\.\d+|\d+\.\d+)\s*(PR)?',
-                table_text
-            )
-
-            if time_entries:
-                # Collect all times with metadata
-                all_times = []
-                current_season_times = []
-                sport_label = 'Indoor' if self.sport == 'indoor' else 'Outdoor'
-
-                for year_str, sport_type, time_str, is_pr in time_entries:
-                    secs = self.time_to_seconds(time_str)
-                    if secs != float('inf'):
-                        entry = {
-                            'year': int(year_str),
-                            'sport': sport_type,
-                            'time': time_str,
-                            'seconds': secs,
-                            'is_pr': is_pr == 'PR'
-                        }
-                        all_times.append(entry)
-
-                        # Check if this is current season
-                        if int(year_str) == self.year and sport_type == sport_label:
-                            current_season_times.append(entry)
-
-                if all_times:
-                    # Sort all times to find PR and previous PR
-                    all_times.sort(key=lambda x: x['seconds'])
-                    best = all_times[0]
-
-                    bests[event] = {
-                        'pr': best['time'],
-                        'pr_seconds': best['seconds'],
-                        'all_times': [t['time'] for t in all_times]  # Keep all times for reference
-                    }
+        try:
+            doc = lxml.html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            return results, bests  # Empty or unparseable page
 
-                    # Previous PR is the second-best all-time
-                    if len(all_times) > 1:
-                        bests[event]['previous_pr'] = all_times[1]['time']
-                        bests[event]['previous_pr_seconds'] = all_times[1]['seconds']
-                        bests[event]['previous_pr_date'] = f"{all_times[1]['year']} {all_times[1]['sport']}"
+        # One pass over the candidate tables, dispatching on each table's role.
+        # Each table's text is extracted once and shared by both role checks.
+        for table in doc.iter('table'):
+            table_text = table.text_content()
 
-                    # Current season record (SR)
-                    if current_season_times:
-                        current_season_times.sort(key=lambda x: x['seconds'])
-                        sr = current_season_times[0]
-                        bests[event]['sr'] = sr['time']
-                        bests[event]['sr_seconds'] = sr['seconds']
+            # Current season's results: dates in format "Sep 5" and times
+            if _MONTH_DAY_RE.search(table_text):
+                self._parse_result_rows(table, athlete_id, athlete_name, results)
 
-                        # Previous SR is second-best this season
-                        if len(current_season_times) > 1:
-                            bests[event]['previous_sr'] = current_season_times[1]['time']
-                            bests[event]['previous_sr_seconds'] = current_season_times[1]['seconds']
+            # Summary table with season/career bests
+            if _SEASON_HEADER_RE.search(table_text):
+                self._parse_season_bests(table_text, bests)
 
         return results, bests
 
-    def get_athlete_bests(self, athlete_id):
-        """Get an athlete's PR and SR for each event."""
-        athlete_url = f"{self.BASE_URL}/athlete/{athlete_id}/{self.sport_config['athlete_path']}"
-        self.driver.get(athlete_url)
-        time.sleep(2)
+    def _parse_result_rows(self, table, athlete_id, athlete_name, results):
+        """Append the recent results listed in a results table."""
+        # Parse table rows: one line per row, then a single regex scan
+        # picks out event headers and result rows in order
+        rows_text = '\n'.join(
+            ' '.join(s for s in (t.strip() for t in row.itertext()) if s).replace('\n', ' ')
+            for row in table.iter('tr')
+        )
+        current_event = None
 
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        for match in _TABLE_ROW_RE.finditer(rows_text):
+            # Event header row (e.g., "5000 Meters", "800 Meters")
+            if match.group('event'):
+                current_event = match.group('event').strip()
+                continue
 
-        bests = {}  # {event: {'pr': time, 'sr': time}}
+            # Result data: place, time, date, meet name
+            if current_event:
+                place = int(match.group('place'))
+                time_str = match.group('time')
+                record_type = match.group('record').upper() if match.group('record') else None
+                month = match.group('month')
+                day = match.group('day')
+                year = match.group('year') if match.group('year') else str(self.year)
+                meet_name = match.group('meet').strip()
+
+                # Parse the date
+                date_str = f"{month} {day}, {year}"
+                result_date = self.parse_date(date_str)
+
+                if result_date and result_date >= self.cutoff_date:
+                    results.append({
+                        'athlete_name': athlete_name,
+                        'athlete_id': athlete_id,
+                        'event': current_event,
+                        'place': place,
+                        'time': time_str,
+                        'time_seconds': self.time_to_seconds(time_str),
+                        'record_type': record_type,  # 'PR', 'SR', or None
+                        'date': result_date,
+                        'date_str': date_str,
+                        'meet_name': meet_name
+                    })
+
+    def _parse_season_bests(self, table_text, bests):
+        """
+        Add PR/SR bests from a season summary table to bests.
+        Format: "5000 Meters 2023 Indoor Fr 18:48.71 2024 Outdoor So 17:13.53 * 2025 Indoor Jr 16:37.46 *"
+        """
+        # Try to extract event name at start of table
+        event_match = _TABLE_EVENT_RE.match(table_text)
+        if not event_match:
+            return
+
+        event = event_match.group(1).strip()
 
-        # Look at the season summary tables (e.g., "5000 Meters 2022 Fr 20:14.1 2023 So 18:57.6 * ...")
-        tables = soup.find_all('table')
+        # Find all times with context (year, sport type)
+        # Pattern: "2025 Indoor Jr 16:37.46" or "2024 Outdoor So 17:13.53PR"
+        time_entries = _SEASON_TIME_RE.findall(table_text)
 
-        for table in tables:
-            table_text = table.get_text()
+        if time_entries:
+            # Collect all times with metadata
+            all_times = []
+            current_season_times = []
+            sport_label = 'Indoor' if self.sport == 'indoor' else 'Outdoor'
 
-            # Look for patterns like "5000 Meters" followed by yearly results
-            event_match = re.match(r'^(\d+(?:,\d+)?\s*(?:Meters?|Mile|Hurdles?|Relay|Steeplechase|Jump|Put|Throw|Vault))', table_text, re.IGNORECASE)
-            if event_match:
-                event = event_match.group(1).strip()
+            # Entries are (seconds, year, sport, time) tuples
+            for year_str, sport_type, time_str, _ in time_entries:
+                secs = self.time_to_seconds(time_str)
+                if secs != float('inf'):
+                    year = int(year_str)
+                    entry = (secs, year, sport_type, time_str)
+                    all_times.append(entry)
 
-                # Find all times in this table
-                times = re.findall(r'(\d{1,2}:\d{2}\.\d+|\d+\.\d+)(PR)?', table_text)
+                    # Check if this is current season
+                    if year == self.year and sport_type == sport_label:
+                        current_season_times.append(entry)
 
-                if times:
-                    # Get the best time (lowest) as PR
-                    all_times = [(t[0], t[1] == 'PR') for t in times]
-                    time_values = [(self.time_to_seconds(t[0]), t[0], t[1]) for t in all_times]
-                    time_values.sort(key=lambda x: x[0])
+            if all_times:
+                # Sort all times to find PR and previous PR
+                all_times.sort(key=itemgetter(0))
+                best_seconds, _, _, best_time = all_times[0]
 
-                    if time_values:
-                        best = time_values[0]
-                        bests[event] = {
-                            'pr': best[1],
-                            'pr_seconds': best[0]
-                        }
+                bests[event] = {
+                    'pr': best_time,
+                    'pr_seconds': best_seconds,
+                    'all_times': [t[3] for t in all_times]  # Keep all times for reference
+                }
 
-                        # Try to find SR (current year's best) - look for year pattern
-                        current_year_pattern = re.compile(rf'{self.year}\s+\w+\s+(\d{{1,2}}:\d{{2}}\.\d+|\d+\.\d+)')
-                        sr_match = current_year_pattern.search(table_text)
-                        if sr_match:
-                            sr_time = sr_match.group(1)
-                            bests[event]['sr'] = sr_time
-                            bests[event]['sr_seconds'] = self.time_to_seconds(sr_time)
+                # Previous PR is the second-best all-time
+                if len(all_times) > 1:
+                    prev_seconds, prev_year, prev_sport, prev_time = all_times[1]
+                    bests[event]['previous_pr'] = prev_time
+                    bests[event]['previous_pr_seconds'] = prev_seconds
+                    bests[event]['previous_pr_date'] = f"{prev_year} {prev_sport}"
+
+                # Current season record (SR)
+                if current_season_times:
+                    current_season_times.sort(key=itemgetter(0))
+                    bests[event]['sr'] = current_season_times[0][3]
+                    bests[event]['sr_seconds'] = current_season_times[0][0]
+
+                    # Previous SR is second-best this season
+                    if len(current_season_times) > 1:
+                        bests[event]['previous_sr'] = current_season_times[1][3]
+                        bests[event]['previous_sr_seconds'] = current_season_times[1][0]
+
+    def _annotate_result(self, result, bests):
+        """
+        Add PR/SR improvement (or distance from the current SR) to a result,
+        using the bests parsed from the same athlete page.
+        """
+        b = bests.get(result['event'])
+        if b is None:
+            return
 
-        return bests
+        record_type = result['record_type']
+        current_seconds = result['time_seconds']
+
+        if record_type == 'PR':
+            # Current PR IS the new time, so compare to previous_pr (second-best all-time)
+            previous_pr = b.get('previous_pr')
+            # Previous best must be of similar magnitude to be valid
+            if previous_pr and _valid_ratio(self.time_to_seconds(previous_pr), current_seconds):
+                result['pr_improvement'] = self.calculate_improvement(result['time'], previous_pr)
+                result['previous_pr'] = previous_pr
+                result['previous_pr_date'] = b.get('previous_pr_date', '')
+
+        elif record_type == 'SR':
+            # Current SR IS the new time, so compare to previous_sr (second-best this season)
+            previous_sr = b.get('previous_sr')
+            if previous_sr and _valid_ratio(self.time_to_seconds(previous_sr), current_seconds):
+                result['sr_improvement'] = self.calculate_improvement(result['time'], previous_sr)
+                result['previous_sr'] = previous_sr
+
+        elif not record_type and b.get('sr'):
+            sr_seconds = b.get('sr_seconds', float('inf'))
+            if sr_seconds != float('inf'):
+                # How close (as %) to SR? Lower is closer
+                result['sr_distance'] = (current_seconds - sr_seconds) / sr_seconds * 100
+                result['current_sr'] = b['sr']
 
     def calculate_improvement(self, current_time_str, previous_time_str):
         """Calculate percentage improvement (lower is better for running)."""
@@ -1767,9 +2203,7 @@ class AthleticNetScraper:
     def run(self):
         """Main execution method."""
         try:
-            self.start_browser()
-
-            # Step 1: Get roster
+            # Step 1: Get roster (the browser is only started if a page needs rendering)
             roster = self.get_roster()
 
             if not roster:
@@ -1782,54 +2216,17 @@ class AthleticNetScraper:
             print(f"\nChecking {len(roster)} athletes for results in the last {self.days_back} days...")
             print(f"Cutoff date: {self.cutoff_date.strftime('%Y-%m-%d')}")
 
-            for i, athlete in enumerate(roster):
-                print(f"  [{i+1}/{len(roster)}] {athlete['name']}...", end=' ')
+            # Fetch all profiles up front; results and bests come from one page load each
+            athlete_data = self.get_athletes_concurrent(roster)
 
-                # Get recent results and bests in one page load
-                results, bests = self.get_athlete_results_and_bests(athlete['id'], athlete['name'])
+            for i, (athlete, results, bests) in enumerate(athlete_data):
+                print(f"  [{i+1}/{len(roster)}] {athlete['name']}...", end=' ')
 
                 if results:
                     print(f"found {len(results)} recent result(s)")
 
                     for result in results:
-                        event = result['event']
-                        current_time = result['time']
-
-                        # Calculate improvements
-                        if event in bests:
-                            # For PRs: use previous_pr (second-best all-time) since current PR IS the new time
-                            previous_pr = bests[event].get('previous_pr')
-                            # For SRs: use previous_sr (second-best this season) since current SR IS the new time
-                            previous_sr = bests[event].get('previous_sr')
-                            # Current SR for non-PR/SR results
-                            sr_best = bests[event].get('sr')
-
-                            # For PRs, calculate improvement vs old PR
-                            if result['record_type'] == 'PR' and previous_pr:
-                                current_seconds = self.time_to_seconds(current_time)
-                                prev_pr_seconds = self.time_to_seconds(previous_pr)
-                                if prev_pr_seconds != float('inf') and 0.5 < prev_pr_seconds / current_seconds < 2.0:
-                                    result['pr_improvement'] = self.calculate_improvement(current_time, previous_pr)
-                                    result['previous_pr'] = previous_pr
-                                    result['previous_pr_date'] = bests[event].get('previous_pr_date', '')
-
-                            # For SRs, calculate improvement vs old SR
-                            if result['record_type'] == 'SR' and previous_sr:
-                                current_seconds = self.time_to_seconds(current_time)
-                                prev_sr_seconds = self.time_to_seconds(previous_sr)
-                                if prev_sr_seconds != float('inf') and 0.5 < prev_sr_seconds / current_seconds < 2.0:
-                                    result['sr_improvement'] = self.calculate_improvement(current_time, previous_sr)
-                                    result['previous_sr'] = previous_sr
-
-                            # For non-PR/SR, calculate distance from current SR
-                            if not result['record_type'] and sr_best:
-                                current_seconds = self.time_to_seconds(current_time)
-                                sr_seconds = bests[event].get('sr_seconds', float('inf'))
-                                if sr_seconds != float('inf'):
-                                    # How close (as %) to SR? Lower is closer
-                                    result['sr_distance'] = (current_seconds - sr_seconds) / sr_seconds * 100
-                                    result['current_sr'] = sr_best
-
+                        self._annotate_result(result, bests)
                         all_results.append(result)
                 else:
                     print("no recent results")
@@ -1841,30 +2238,8 @@ class AthleticNetScraper:
             # Step 3: Sort results
             print(f"\nFound {len(all_results)} total results. Sorting...")
 
-            # Separate into PRs, SRs, FTs (First Time), others, and DNS/DNF
-            prs = [r for r in all_results if r.get('record_type') == 'PR']
-            srs = [r for r in all_results if r.get('record_type') == 'SR']
-            fts = [r for r in all_results if r.get('record_type') == 'FT']
-            dns_dnf = [r for r in all_results if not r.get('record_type') and r.get('time', '').upper() in ['DNS', 'DNF']]
-            others = [r for r in all_results if not r.get('record_type') and r.get('time', '').upper() not in ['DNS', 'DNF']]
-
-            # Sort PRs by improvement (highest improvement first)
-            prs.sort(key=lambda x: x.get('pr_improvement', 0), reverse=True)
-
-            # Sort SRs by improvement (highest improvement first)
-            srs.sort(key=lambda x: x.get('sr_improvement', 0), reverse=True)
-
-            # Sort FTs alphabetically by name
-            fts.sort(key=lambda x: x.get('athlete_name', ''))
-
-            # Sort others alphabetically by name
-            others.sort(key=lambda x: x.get('athlete_name', ''))
-
-            # Sort DNS/DNF alphabetically by name
-            dns_dnf.sort(key=lambda x: x.get('athlete_name', ''))
-
-            # Combine in order: PRs -> SRs -> FTs -> other results -> DNS/DNF
-            sorted_results = prs + srs + fts + others + dns_dnf
+            # Order: PRs (by improvement) -> SRs (by improvement) -> FTs -> other results -> DNS/DNF
+            sorted_results = sorted(all_results, key=_result_sort_key)
 
             # Step 4: Create spreadsheet
             return self.save_to_spreadsheet(sorted_results)
@@ -1883,65 +2258,9 @@ class AthleticNetScraper:
             print("No results to save.")
             return None
 
-        # Prepare data for DataFrame
-        data = []
-        for r in results:
-            prev_pr = r.get('previous_pr')
-            prev_sr = r.get('previous_sr')
-            pr_improvement = r.get('pr_improvement', 0)
-            sr_improvement = r.get('sr_improvement', 0)
-
-            row = {
-                'Name': r['athlete_name'],
-                'Type': r.get('record_type', '-'),
-                'Event': r['event'],
-                'Time/Mark': r['time'],
-                'Place': r['place'],
-                'Date': r['date_str'],
-                'Meet': r['meet_name'],
-            }
-
-            # Previous Best (PR) column
-            if r.get('record_type') == 'FT' or r.get('first_at_distance'):
-                row['Previous Best'] = '-'
-                row['PR Date'] = '-'
-            elif prev_pr:
-                row['Previous Best'] = prev_pr
-                row['PR Date'] = r.get('previous_pr_date', '') or '-'
-            else:
-                row['Previous Best'] = '-'
-                row['PR Date'] = '-'
-
-            # Previous Season Best column
-            row['Previous SR'] = prev_sr if prev_sr else '-'
-            row['SR Date'] = r.get('previous_sr_date', '') or '-' if prev_sr else '-'
-
-            # % Improvement from PR column
-            if r.get('record_type') == 'PR' and prev_pr:
-                row['% from PR'] = f"{pr_improvement:.2f}%"
-            elif r.get('record_type') == 'FT' or not prev_pr:
-                row['% from PR'] = '-'
-            elif pr_improvement != 0:
-                row['% from PR'] = f"{pr_improvement:.2f}%"
-            else:
-                row['% from PR'] = '-'
-
-            # % Improvement from SR column
-            if r.get('record_type') == 'SR' and prev_sr:
-                row['% from SR'] = f"{sr_improvement:.2f}%"
-            elif not prev_sr:
-                row['% from SR'] = '-'
-            elif sr_improvement != 0:
-                row['% from SR'] = f"{sr_improvement:.2f}%"
-            else:
-                row['% from SR'] = '-'
-
-            data.append(row)
-
-        df = pd.DataFrame(data)
+        from openpyxl import Workbook
 
         columns = ['Name', 'Type', 'Event', 'Time/Mark', 'Place', 'Date', 'Meet', 'Previous Best', 'PR Date', 'Previous SR', 'SR Date', '% from PR', '% from SR']
-        df = df[columns]
 
         if filename is None:
             sport_name = self.sport_config['name'].replace(' ', '_').replace('&', 'and')
@@ -1949,12 +2268,22 @@ class AthleticNetScraper:
             filename = f"results_{sport_name}_{self.year}_{today}.xlsx"
 
         filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
-        df.to_excel(filepath, index=False, sheet_name='Results')
 
+        # Stream rows straight into a write-only workbook (constant memory)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Results')
+        ws.append(columns)
+
+        for row in map(_build_result_row, results):
+            ws.append([row[c] for c in columns])
+
+        _save_workbook_atomic(wb, filepath)
+
+        type_counts = Counter(r.get('record_type') or None for r in results)
         print(f"\nResults saved to: {filepath}")
-        print(f"  PRs: {len([r for r in results if r.get('record_type') == 'PR'])}")
-        print(f"  SRs: {len([r for r in results if r.get('record_type') == 'SR'])}")
-        print(f"  Others: {len([r for r in results if not r.get('record_type')])}")
+        print(f"  PRs: {type_counts['PR']}")
+        print(f"  SRs: {type_counts['SR']}")
+        print(f"  Others: {type_counts[None]}")
 
         return filepath
 
@@ -2023,15 +2352,8 @@ def get_relevant_sports(days_back):
         # Very long lookback into last year's outdoor (unlikely but possible)
         sports.append(('outdoor', current_year - 1))
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique = []
-    for s in sports:
-        if s not in seen:
-            seen.add(s)
-            unique.append(s)
-
-    return unique
+    # Each sport is appended at most once above, so no dedupe is needed
+    return sports
 
 
 def _push_results_to_website(data, cutoff_date, end_date, checked_sports, cloud_mode=False):
@@ -2114,9 +2436,27 @@ def _push_results_to_website(data, cutoff_date, end_date, checked_sports, cloud_
         print(f"\nNo changes to push to website")
 
 
-def _save_styled_excel(df, filepath, sorted_results):
+def _save_workbook_atomic(wb, filepath):
     """
-    Save DataFrame to Excel with professional styling.
+    Save a workbook to a temporary file beside filepath, then rename it
+    into place so an interrupted run never leaves a truncated spreadsheet.
+    """
+    tmp_path = filepath + '.part'
+    try:
+        wb.save(tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _save_styled_excel(data, columns, filepath):
+    """
+    Save result rows to Excel with professional styling.
+
+    Rows are streamed into a write-only workbook, so each cell is styled
+    as it is appended instead of being revisited after the sheet is built.
 
     Features:
     - Proper column widths for readability
@@ -2127,28 +2467,23 @@ def _save_styled_excel(df, filepath, sorted_results):
     - Borders for structure
     """
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.formatting.rule import ColorScaleRule
-    from openpyxl.utils.dataframe import dataframe_to_rows
     from openpyxl.utils import get_column_letter
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Results"
-
-    # Write data to worksheet
-    for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), 1):
-        for c_idx, value in enumerate(row, 1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Results")
 
     # Define styles
     header_fill = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
     header_font = Font(bold=True, color="FFFFFF", size=11)
     header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
-    pr_fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")  # Gold
-    sr_fill = PatternFill(start_color="C0C0C0", end_color="C0C0C0", fill_type="solid")  # Silver
-    ft_fill = PatternFill(start_color="ADD8E6", end_color="ADD8E6", fill_type="solid")  # Light Blue
+    type_fills = {
+        'PR': PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid"),  # Gold
+        'SR': PatternFill(start_color="C0C0C0", end_color="C0C0C0", fill_type="solid"),  # Silver
+        'FT': PatternFill(start_color="ADD8E6", end_color="ADD8E6", fill_type="solid"),  # Light Blue
+    }
 
     alt_row_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
 
@@ -2180,151 +2515,213 @@ def _save_styled_excel(df, filepath, sorted_results):
         14: 10,  # vs NCAA
     }
 
+    # Write-only sheets need dimensions and panes set before any rows are appended
     for col_idx, width in column_widths.items():
         ws.column_dimensions[get_column_letter(col_idx)].width = width
 
-    # Style header row
-    for col_idx in range(1, len(df.columns) + 1):
-        cell = ws.cell(row=1, column=col_idx)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-    # Set header row height
-    ws.row_dimensions[1].height = 25
+    # Freeze the header row
+    ws.freeze_panes = 'A2'
 
-    # Style data rows
     type_col = 2  # Type column index
     pr_improvement_col = 11  # % from PR column index
     sr_improvement_col = 12  # % from SR column index
+    ncaa_col = 14  # vs NCAA column index
+    event_col = 4  # Event column to check if field event
 
-    for row_idx in range(2, len(df) + 2):
-        # Set row height
-        ws.row_dimensions[row_idx].height = 22
+    qualified_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")  # Light green
+    close_fill = PatternFill(start_color="FFFF99", end_color="FFFF99", fill_type="solid")  # Light yellow (within 5%)
 
-        for col_idx in range(1, len(df.columns) + 1):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            cell.border = thin_border
+    # Style objects are shared between cells rather than rebuilt per cell
+    bold_font = Font(bold=True)
+    qualified_font = Font(bold=True, color="006400")  # Dark green text
+    gradient_light_font = Font(bold=True, color="FFFFFF")
+    gradient_dark_font = Font(bold=True, color="1F4E79")
+    gradient_fills = {}  # hex color -> PatternFill
 
-            # Center alignment for most columns, left for Name and Meet
-            if col_idx in [1, 8]:  # Name and Meet columns
-                cell.alignment = left_align
-            else:
-                cell.alignment = center_align
-
-        # Color-code the Type column
-        type_cell = ws.cell(row=row_idx, column=type_col)
-        type_value = type_cell.value
-        if type_value == 'PR':
-            type_cell.fill = pr_fill
-            type_cell.font = Font(bold=True)
-        elif type_value == 'SR':
-            type_cell.fill = sr_fill
-            type_cell.font = Font(bold=True)
-        elif type_value == 'FT':
-            type_cell.fill = ft_fill
-            type_cell.font = Font(bold=True)
-
-        # Alternating row colors (only for non-highlighted cells)
-        if row_idx % 2 == 0:
-            for col_idx in range(1, len(df.columns) + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                # Don't override Type column fill
-                if col_idx != type_col or (type_value not in ['PR', 'SR', 'FT']):
-                    if cell.fill == PatternFill():  # No fill yet
-                        cell.fill = alt_row_fill
-
-    # Apply gradient to both improvement columns
-    def apply_gradient_to_column(col_idx):
-        """Apply green gradient to improvement percentage column."""
-        improvement_values = []
-        for row_idx in range(2, len(df) + 2):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            value = cell.value
-            if value and '%' in str(value) and value != '-':
-                try:
-                    num_value = float(str(value).replace('%', '').strip())
-                    improvement_values.append((row_idx, num_value))
-                except ValueError:
-                    pass
+    def parse_pct(value):
+        """Parse a '12.34%' style cell value, or None if it isn't one."""
+        if value and '%' in str(value) and value != '-':
+            try:
+                return float(str(value).replace('%', '').replace('+', '').strip())
+            except ValueError:
+                pass
+        return None
 
-        if improvement_values:
-            values_only = [v for _, v in improvement_values]
-            min_val = min(values_only) if values_only else 0
-            max_val = max(values_only) if values_only else 1
+    # The gradient is scaled to each improvement column's range, so
+    # collect both ranges up front before any row is written
+    gradient_ranges = {}
+    for col_idx in (pr_improvement_col, sr_improvement_col):
+        if col_idx > len(columns):
+            continue
+        col_name = columns[col_idx - 1]
+        values = [v for v in (parse_pct(row[col_name]) for row in data) if v is not None]
+        if values:
+            gradient_ranges[col_idx] = (min(values), max(values))
+
+    def apply_gradient(cell, value, min_val, max_val):
+        """Apply green gradient to an improvement percentage cell."""
+        if max_val > min_val:
+            normalized = (value - min_val) / (max_val - min_val)
+        else:
+            normalized = 0.5
 
-            for row_idx, value in improvement_values:
-                cell = ws.cell(row=row_idx, column=col_idx)
+        # Gradient: light green to dark green for positive, light red for negative
+        if value >= 0:
+            r = int(200 - normalized * (200 - 34))
+            g = int(230 - normalized * (230 - 139))
+            b = int(200 - normalized * (200 - 34))
+        else:
+            # Red tint for negative (slower than PR/SR)
+            r = 255
+            g = int(200 + value * 5)  # Gets redder as more negative
+            b = int(200 + value * 5)
+            g = max(150, min(200, g))
+            b = max(150, min(200, b))
+
+        hex_color = f"{r:02X}{g:02X}{b:02X}"
+        fill = gradient_fills.get(hex_color)
+        if fill is None:
+            fill = gradient_fills[hex_color] = PatternFill(start_color=hex_color, end_color=hex_color, fill_type="solid")
+        cell.fill = fill
+
+        if value >= 0 and normalized > 0.6:
+            cell.font = gradient_light_font
+        else:
+            cell.font = gradient_dark_font
 
-                if max_val > min_val:
-                    normalized = (value - min_val) / (max_val - min_val)
-                else:
-                    normalized = 0.5
+    # Header row
+    ws.row_dimensions[1].height = 25
+    header_cells = []
+    for col_name in columns:
+        cell = WriteOnlyCell(ws, value=col_name)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+        cell.border = thin_border
+        header_cells.append(cell)
+    ws.append(header_cells)
 
-                # Gradient: light green to dark green for positive, light red for negative
-                if value >= 0:
-                    r = int(200 - normalized * (200 - 34))
-                    g = int(230 - normalized * (230 - 139))
-                    b = int(200 - normalized * (200 - 34))
-                else:
-                    # Red tint for negative (slower than PR/SR)
-                    r = 255
-                    g = int(200 + value * 5)  # Gets redder as more negative
-                    b = int(200 + value * 5)
-                    g = max(150, min(200, g))
-                    b = max(150, min(200, b))
-
-                hex_color = f"{r:02X}{g:02X}{b:02X}"
-                cell.fill = PatternFill(start_color=hex_color, end_color=hex_color, fill_type="solid")
-
-                if value >= 0 and normalized > 0.6:
-                    cell.font = Font(bold=True, color="FFFFFF")
-                else:
-                    cell.font = Font(bold=True, color="1F4E79")
+    # Center alignment for most columns, left for Name and Meet
+    column_aligns = [left_align if col_idx in (1, 8) else center_align for col_idx in range(1, len(columns) + 1)]
 
-    apply_gradient_to_column(pr_improvement_col)
-    apply_gradient_to_column(sr_improvement_col)
+    # Data rows
+    for row_idx, row in enumerate(data, 2):
+        ws.row_dimensions[row_idx].height = 22
+        type_value = row[columns[type_col - 1]]
 
-    # Highlight qualified athletes in "vs NCAA" column (column 14)
-    ncaa_col = 14
-    event_col = 4  # Event column to check if field event
-    qualified_fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")  # Light green
-    close_fill = PatternFill(start_color="FFFF99", end_color="FFFF99", fill_type="solid")  # Light yellow (within 5%)
+        cells = []
+        for col_idx, col_name in enumerate(columns, 1):
+            value = row[col_name]
+            cell = WriteOnlyCell(ws, value=value)
+            cell.border = thin_border
+            cell.alignment = column_aligns[col_idx - 1]
+
+            # Color-code the Type column
+            if col_idx == type_col and type_value in type_fills:
+                cell.fill = type_fills[type_value]
+                cell.font = bold_font
+            elif row_idx % 2 == 0:
+                # Alternating row colors (only for non-highlighted cells)
+                cell.fill = alt_row_fill
+
+            # Gradient on both improvement columns
+            if col_idx in gradient_ranges:
+                pct = parse_pct(value)
+                if pct is not None:
+                    apply_gradient(cell, pct, *gradient_ranges[col_idx])
+
+            # Highlight qualified athletes in "vs NCAA" column
+            if col_idx == ncaa_col:
+                num_value = parse_pct(value)
+                if num_value is not None:
+                    # Check if this is a field event (higher is better)
+                    event_name = str(row[columns[event_col - 1]] or '').lower()
+                    is_field_event = any(f in event_name for f in ['jump', 'vault', 'put', 'throw', 'discus', 'hammer', 'javelin'])
+
+                    # Determine if qualified based on event type
+                    # Time events: negative % = faster than standard = QUALIFIED
+                    # Field events: positive % = further/higher than standard = QUALIFIED
+                    is_qualified = (is_field_event and num_value >= 0) or (not is_field_event and num_value <= 0)
+                    is_close = abs(num_value) <= 5
+
+                    if is_qualified:
+                        # Qualified! Highlight green
+                        cell.fill = qualified_fill
+                        cell.font = qualified_font
+                    elif is_close:
+                        # Close to qualifying (within 5%) - highlight yellow
+                        cell.fill = close_fill
+                        cell.font = bold_font
+
+            cells.append(cell)
+
+        ws.append(cells)
 
-    for row_idx in range(2, len(df) + 2):
-        cell = ws.cell(row=row_idx, column=ncaa_col)
-        value = cell.value
-        if value and '%' in str(value) and value != '-':
-            try:
-                # Check if this is a field event (higher is better)
-                event_name = str(ws.cell(row=row_idx, column=event_col).value or '').lower()
-                is_field_event = any(f in event_name for f in ['jump', 'vault', 'put', 'throw', 'discus', 'hammer', 'javelin'])
-
-                num_value = float(str(value).replace('%', '').replace('+', '').strip())
-
-                # Determine if qualified based on event type
-                # Time events: negative % = faster than standard = QUALIFIED
-                # Field events: positive % = further/higher than standard = QUALIFIED
-                is_qualified = (is_field_event and num_value >= 0) or (not is_field_event and num_value <= 0)
-                is_close = abs(num_value) <= 5
-
-                if is_qualified:
-                    # Qualified! Highlight green
-                    cell.fill = qualified_fill
-                    cell.font = Font(bold=True, color="006400")  # Dark green text
-                elif is_close:
-                    # Close to qualifying (within 5%) - highlight yellow
-                    cell.fill = close_fill
-                    cell.font = Font(bold=True)
-            except ValueError:
-                pass
+    # Save the workbook
+    _save_workbook_atomic(wb, filepath)
+
+
+def _build_result_row(r):
+    """Format one annotated result as a row dict for the spreadsheet and website."""
+    record_type = r.get('record_type')
+    prev_pr = r.get('previous_pr')
+    prev_sr = r.get('previous_sr')
+    pr_improvement = r.get('pr_improvement', 0)
+    sr_improvement = r.get('sr_improvement', 0)
+
+    # First times (and first races at a distance) have no meaningful previous PR
+    has_pr = bool(prev_pr) and record_type != 'FT' and not r.get('first_at_distance')
+    show_pr_pct = bool(prev_pr) and record_type != 'FT' and (record_type == 'PR' or pr_improvement != 0)
+    show_sr_pct = bool(prev_sr) and (record_type == 'SR' or sr_improvement != 0)
+
+    row = {
+        'Name': r['athlete_name'],
+        'Type': record_type or '-',
+        'Sport': r.get('sport', ''),
+        'Event': r['event'],
+        'Time/Mark': r['time'],
+        'Place': r['place'],
+        'Date': r['date_str'],
+        'Meet': r['meet_name'],
+        'Previous Best': prev_pr if has_pr else '-',
+        'PR Date': (r.get('previous_pr_date') or '-') if has_pr else '-',
+        'Previous SR': prev_sr or '-',
+        'SR Date': (r.get('previous_sr_date') or '-') if prev_sr else '-',
+        '% from PR': f"{pr_improvement:.2f}%" if show_pr_pct else '-',
+        '% from SR': f"{sr_improvement:.2f}%" if show_sr_pct else '-',
+        'NCAA Std': '-',
+        'vs NCAA': '-',
+    }
 
-    # Freeze the header row
-    ws.freeze_panes = 'A2'
+    # NCAA D2 Standard columns
+    ncaa_standard = r.get('ncaa_standard')
+    if ncaa_standard:
+        ncaa_diff_pct = r.get('ncaa_diff_pct')
+        is_field = any(f in r['event'].lower() for f in ['jump', 'vault', 'put', 'throw', 'discus', 'hammer', 'javelin'])
+        row['NCAA Std'] = f"{ncaa_standard:.2f}m" if is_field else format_standard_time(ncaa_standard)
+        # Field: positive % = over standard (qualified); time: negative % = under standard (qualified)
+        if ncaa_diff_pct is not None:
+            plus = ncaa_diff_pct >= 0 if is_field else ncaa_diff_pct > 0
+            row['vs NCAA'] = f"{'+' if plus else ''}{ncaa_diff_pct:.1f}%"
+
+    # GLVC Conference Ranking columns
+    glvc_rank = r.get('glvc_rank')
+    glvc_sec_ahead = r.get('glvc_sec_ahead')
+    glvc_sec_behind = r.get('glvc_sec_behind')
+    is_field = r.get('glvc_is_field', False)
+
+    if glvc_rank is not None:
+        # Athlete is ranked in GLVC (top 16)
+        row['GLVC Rank'] = str(glvc_rank)
+        row['Sec Ahead'] = format_gap(glvc_sec_ahead, is_field) if glvc_sec_ahead is not None else '-'
+        row['Sec Behind'] = format_gap(glvc_sec_behind, is_field) if glvc_sec_behind is not None else '-'
+    else:
+        # Not ranked (NR) - sec_behind shows gap to 16th place (qualifying)
+        row['GLVC Rank'] = 'NR'
+        row['Sec Ahead'] = '-'
+        row['Sec Behind'] = f"+{format_gap(glvc_sec_behind, is_field)}" if glvc_sec_behind is not None else '-'
 
-    # Save the workbook
-    wb.save(filepath)
+    return row
 
 
 def main():
@@ -2351,14 +2748,29 @@ def main():
                         help='Save output to Desktop instead of uisResults folder')
     parser.add_argument('--cloud', action='store_true',
                         help='Cloud mode: output JSON to current directory (for GitHub Actions)')
+    parser.add_argument('--persistent-browser', action='store_true',
+                        help='Keep one headless Chrome running between runs and attach to it')
+    parser.add_argument('--parallel-tabs', type=int, default=8,
+                        help='Browser tabs to load at once in the Selenium fallback (default: 8)')
+    parser.add_argument('--output-dir', default=None,
+                        help='Directory to save the spreadsheet in. Precedence: --output-dir, --cloud, '
+                             '--desktop, then $UISRESULTS_DIR, then the script folder')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-download athlete pages instead of reusing ones cached in the last 6 hours')
 
     args = parser.parse_args()
 
-    # Set output directory
-    if args.cloud:
+    # Set output directory (explicit flags win over the environment default)
+    if args.output_dir:
+        output_dir = os.path.expanduser(args.output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+    elif args.cloud:
         output_dir = "."  # Current directory for GitHub Actions
     elif args.desktop:
         output_dir = os.path.expanduser("~/Desktop")
+    elif os.environ.get('UISRESULTS_DIR'):
+        output_dir = os.path.expanduser(os.environ['UISRESULTS_DIR'])
+        os.makedirs(output_dir, exist_ok=True)
     else:
         output_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -2422,32 +2834,41 @@ def main():
     print()
 
     # Start browser ONCE and reuse it
-    options = Options()
-    # Use new headless mode - more compatible with modern sites like Angular
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-background-networking")
-    options.add_argument("--crash-dumps-dir=/tmp")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-    # Enable performance logging to capture API tokens
-    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-
     print("Starting browser...")
     print("  Checking ChromeDriver...")
-    service = Service(ChromeDriverManager().install())
-    print("  Launching Chrome...")
-    driver = webdriver.Chrome(service=service, options=options)
+    driver_path = get_chromedriver_path()
+
+    if args.persistent_browser:
+        # Attach to a long-lived Chrome instead of paying cold start every run
+        debugger_address, reused = ensure_persistent_chrome()
+        if reused:
+            print(f"  Attaching to running Chrome ({debugger_address})...")
+        else:
+            print(f"  Launching Chrome (persistent, {debugger_address})...")
+        options = build_chrome_options(debugger_address=debugger_address)
+    else:
+        print("  Launching Chrome...")
+        options = build_chrome_options()
+    driver, driver_path = start_chrome(options, driver_path)
+    block_heavy_resources(driver)
 
     # Initialize API client
     api = AthleticNetAPI()
     api_initialized = False
     use_api = True  # Will be set to False if API fails
 
+    # One scraper shares the browser across all sports; it is re-pointed per sport
+    first_sport, first_year = sports_to_check[0]
+    scraper = AthleticNetScraper(
+        headless=args.headless,
+        year=first_year,
+        sport=first_sport,
+        days_back=args.days,
+        driver=driver,
+        use_cache=not args.no_cache,
+        driver_path=driver_path
+    )
+
     try:
         for sport, year in sports_to_check:
             sport_name = sport_names[sport]
@@ -2457,14 +2878,7 @@ def main():
             print(f"Checking {sport_name} {year}...")
             print('='*50)
 
-            scraper = AthleticNetScraper(
-                headless=args.headless,
-                year=year,
-                sport=sport,
-                days_back=args.days
-            )
-            # Share the browser instead of starting a new one
-            scraper.driver = driver
+            scraper.reconfigure(sport, year, args.days)
 
             # Build team URL for API referer
             team_url = f"https://www.athletic.net/team/65580/{scraper.sport_config['url_path']}/{year}"
@@ -2473,8 +2887,8 @@ def main():
             print(f"Loading team page...")
             driver.get(team_url)
 
-            # Wait for page to fully load (important for token capture)
-            time.sleep(2)
+            # Wait for the roster to render - its API calls carry the tokens we capture
+            wait_for_element(driver, ATHLETE_LINK, 5)
 
             # Initialize API on first sport (capture tokens from network logs)
             if not api_initialized and use_api:
@@ -2558,6 +2972,12 @@ def main():
                 print(f"No roster found for {sport_name} {year}")
                 continue
 
+            # Skip the sport outright if every athlete was already checked
+            roster_ids = {a['id'] for a in roster}
+            if roster_ids <= checked_athletes:
+                print(f"All {len(roster)} athletes already checked - skipping")
+                continue
+
             # Filter out already-checked athletes
             new_athletes = [a for a in roster if a['id'] not in checked_athletes]
             skipped = len(roster) - len(new_athletes)
@@ -2568,8 +2988,7 @@ def main():
                 print(f"Checking {len(new_athletes)} athletes...")
 
             # Mark all as checked
-            for athlete in new_athletes:
-                checked_athletes.add(athlete['id'])
+            checked_athletes |= roster_ids
 
             # Process athletes - old API approach (fallback)
             if use_api and api_initialized:
@@ -2599,26 +3018,27 @@ def main():
                         print(f"found {len(results)} recent result(s)")
                         for result in results:
                             result['sport'] = sport_name
-                            event = result['event']
-                            current_time = result['time']
+                            b = bests.get(result['event'])
+                            if b is None:
+                                all_results.append(result)
+                                continue
 
                             # Calculate improvements
-                            if event in bests:
-                                sr_best = bests[event].get('sr')
+                            sr_best = b.get('sr')
 
-                                if result['record_type'] == 'PR' and bests[event].get('pr'):
-                                    result['previous_pr'] = bests[event].get('pr')
-                                    # Note: API doesn't give us "previous PR", just current PR
+                            if result['record_type'] == 'PR' and b.get('pr'):
+                                result['previous_pr'] = b['pr']
+                                # Note: API doesn't give us "previous PR", just current PR
 
-                                if result['record_type'] == 'SR' and sr_best:
-                                    result['previous_sr'] = sr_best
+                            if result['record_type'] == 'SR' and sr_best:
+                                result['previous_sr'] = sr_best
 
-                                if not result['record_type'] and sr_best:
-                                    current_seconds = scraper.time_to_seconds(current_time)
-                                    sr_seconds = bests[event].get('sr_seconds', float('inf'))
-                                    if sr_seconds != float('inf'):
-                                        result['sr_distance'] = (current_seconds - sr_seconds) / sr_seconds * 100
-                                        result['current_sr'] = sr_best
+                            if not result['record_type'] and sr_best:
+                                current_seconds = result['time_seconds']
+                                sr_seconds = b.get('sr_seconds', float('inf'))
+                                if sr_seconds != float('inf'):
+                                    result['sr_distance'] = (current_seconds - sr_seconds) / sr_seconds * 100
+                                    result['current_sr'] = sr_best
 
                             all_results.append(result)
                     else:
@@ -2632,15 +3052,17 @@ def main():
             else:
                 remaining_athletes = new_athletes
 
-            # Selenium fallback (or primary if API not available)
+            # Page scraping fallback (or primary if API not available):
+            # concurrent HTTP fetches, with browser tabs for pages that need rendering
             if remaining_athletes:
-                NUM_PARALLEL_TABS = 1  # Single tab to avoid window handle crashes in CI
-                for batch_start in range(0, len(remaining_athletes), NUM_PARALLEL_TABS):
-                    batch = remaining_athletes[batch_start:batch_start + NUM_PARALLEL_TABS]
+                num_tabs = max(1, min(args.parallel_tabs, AthleticNetScraper.MAX_PARALLEL_TABS))
+                batch_size = max(num_tabs, AthleticNetScraper.HTTP_WORKERS)
+                for batch_start in range(0, len(remaining_athletes), batch_size):
+                    batch = remaining_athletes[batch_start:batch_start + batch_size]
                     batch_names = ', '.join(a['name'] for a in batch)
                     print(f"  [{batch_start+1}-{batch_start+len(batch)}/{len(remaining_athletes)}] {batch_names}...", end=' ', flush=True)
 
-                    batch_data = scraper.get_athletes_parallel(batch, num_tabs=NUM_PARALLEL_TABS)
+                    batch_data = scraper.get_athletes_concurrent(batch, num_tabs=num_tabs)
 
                     found_count = sum(1 for _, results, _ in batch_data if results)
                     if found_count > 0:
@@ -2653,44 +3075,8 @@ def main():
                             continue
 
                         for result in results:
-                            event = result['event']
-                            current_time = result['time']
                             result['sport'] = sport_name
-
-                            # Calculate improvements
-                            if event in bests:
-                                # For PRs: use previous_pr (second-best all-time) since current PR IS the new time
-                                previous_pr = bests[event].get('previous_pr')
-                                # For SRs: use previous_sr (second-best this season) since current SR IS the new time
-                                previous_sr = bests[event].get('previous_sr')
-                                # Current SR for non-PR/SR results
-                                sr_best = bests[event].get('sr')
-
-                                if result['record_type'] == 'PR' and previous_pr:
-                                    # Validate that previous best is reasonable (similar magnitude to current)
-                                    current_secs = scraper.time_to_seconds(current_time)
-                                    prev_pr_secs = scraper.time_to_seconds(previous_pr)
-                                    # Previous best should be within 50% of current time to be valid
-                                    if prev_pr_secs != float('inf') and 0.5 < prev_pr_secs / current_secs < 2.0:
-                                        result['pr_improvement'] = scraper.calculate_improvement(current_time, previous_pr)
-                                        result['previous_pr'] = previous_pr
-                                        result['previous_pr_date'] = bests[event].get('previous_pr_date', '')
-
-                                if result['record_type'] == 'SR' and previous_sr:
-                                    # Validate that previous SR is reasonable
-                                    current_secs = scraper.time_to_seconds(current_time)
-                                    prev_sr_secs = scraper.time_to_seconds(previous_sr)
-                                    if prev_sr_secs != float('inf') and 0.5 < prev_sr_secs / current_secs < 2.0:
-                                        result['sr_improvement'] = scraper.calculate_improvement(current_time, previous_sr)
-                                        result['previous_sr'] = previous_sr
-
-                                if not result['record_type'] and sr_best:
-                                    current_seconds = scraper.time_to_seconds(current_time)
-                                    sr_seconds = bests[event].get('sr_seconds', float('inf'))
-                                    if sr_seconds != float('inf'):
-                                        result['sr_distance'] = (current_seconds - sr_seconds) / sr_seconds * 100
-                                        result['current_sr'] = sr_best
-
+                            scraper._annotate_result(result, bests)
                             all_results.append(result)
 
     finally:
@@ -2786,7 +3172,7 @@ def main():
         is_field = any(f in r['event'].lower() for f in ['jump', 'vault', 'put', 'throw', 'discus', 'hammer', 'javelin'])
         if is_field:
             try:
-                result_distance = float(re.sub(r'[^\d.]', '', r['time'].replace('m', '')))
+                result_distance = float(_NON_NUMERIC_RE.sub('', r['time'].replace('m', '')))
                 r['ncaa_diff'] = result_distance - ncaa_std
                 if ncaa_std > 0:
                     r['ncaa_diff_pct'] = (r['ncaa_diff'] / ncaa_std) * 100
@@ -2818,9 +3204,11 @@ def main():
     # Fetch rankings from TFRRS and enrich results
     # Fetch rankings for each active season (indoor/outdoor)
     glvc_by_season = {}
+    glvc_session = None  # shared so the second list reuses the first's TFRRS connection
     for season in ['indoor', 'outdoor']:
         if season in checked_sports:
-            glvc = GLVCRankings()
+            glvc = GLVCRankings(session=glvc_session)
+            glvc_session = glvc.session
             print(f"\nFetching GLVC {season} conference rankings from TFRRS...")
             if glvc.fetch_rankings(season=season):
                 glvc_by_season[season] = glvc
@@ -2881,144 +3269,14 @@ def main():
     # Sort results: PRs by improvement, SRs by improvement, others by closeness to SR
     print(f"\nFound {len(all_results)} total results. Sorting...")
 
-    prs = [r for r in all_results if r.get('record_type') == 'PR']
-    srs = [r for r in all_results if r.get('record_type') == 'SR']
-    fts = [r for r in all_results if r.get('record_type') == 'FT']
-    # Separate DNS/DNF from other results
-    dns_dnf = [r for r in all_results if not r.get('record_type') and r.get('time', '').upper() in ['DNS', 'DNF']]
-    others = [r for r in all_results if not r.get('record_type') and r.get('time', '').upper() not in ['DNS', 'DNF']]
-
-    prs.sort(key=lambda x: x.get('pr_improvement', 0), reverse=True)
-    srs.sort(key=lambda x: x.get('sr_improvement', 0), reverse=True)
-    fts.sort(key=lambda x: x.get('athlete_name', ''))
-    others.sort(key=lambda x: x.get('athlete_name', ''))
-    dns_dnf.sort(key=lambda x: x.get('athlete_name', ''))
-
-    # Order: PRs -> SRs -> FTs -> other results -> DNS/DNF
-    sorted_results = prs + srs + fts + others + dns_dnf
+    # Order: PRs -> SRs -> FTs -> other results -> DNS/DNF, in one sort
+    sorted_results = sorted(all_results, key=_result_sort_key)
+    group_counts = Counter(_result_group(r) for r in sorted_results)
 
     # Save to spreadsheet
-    data = []
-    for r in sorted_results:
-        prev_pr = r.get('previous_pr')
-        prev_sr = r.get('previous_sr')
-        pr_improvement = r.get('pr_improvement', 0)
-        sr_improvement = r.get('sr_improvement', 0)
-
-        row = {
-            'Name': r['athlete_name'],
-            'Type': r.get('record_type') or '-',
-            'Sport': r.get('sport', ''),
-            'Event': r['event'],
-            'Time/Mark': r['time'],
-            'Place': r['place'],
-            'Date': r['date_str'],
-            'Meet': r['meet_name'],
-        }
-
-        # Previous Best (PR) column
-        if r.get('record_type') == 'FT' or r.get('first_at_distance'):
-            row['Previous Best'] = '-'
-            row['PR Date'] = '-'
-        elif prev_pr:
-            row['Previous Best'] = prev_pr
-            row['PR Date'] = r.get('previous_pr_date', '') or '-'
-        else:
-            row['Previous Best'] = '-'
-            row['PR Date'] = '-'
-
-        # Previous Season Best column
-        if prev_sr:
-            row['Previous SR'] = prev_sr
-            row['SR Date'] = r.get('previous_sr_date', '') or '-'
-        else:
-            row['Previous SR'] = '-'
-            row['SR Date'] = '-'
-
-        # % Improvement from PR column
-        if r.get('record_type') == 'PR' and prev_pr:
-            row['% from PR'] = f"{pr_improvement:.2f}%"
-        elif r.get('record_type') == 'FT' or not prev_pr:
-            row['% from PR'] = '-'
-        elif pr_improvement > 0:
-            row['% from PR'] = f"{pr_improvement:.2f}%"
-        elif pr_improvement < 0:
-            row['% from PR'] = f"{pr_improvement:.2f}%"
-        else:
-            row['% from PR'] = '-'
-
-        # % Improvement from SR column
-        if r.get('record_type') == 'SR' and prev_sr:
-            row['% from SR'] = f"{sr_improvement:.2f}%"
-        elif not prev_sr:
-            row['% from SR'] = '-'
-        elif sr_improvement != 0:
-            row['% from SR'] = f"{sr_improvement:.2f}%"
-        else:
-            row['% from SR'] = '-'
-
-        # NCAA D2 Standard columns
-        ncaa_standard = r.get('ncaa_standard')
-        ncaa_diff = r.get('ncaa_diff')
-        ncaa_diff_pct = r.get('ncaa_diff_pct')
-
-        if ncaa_standard:
-            # Format the standard as a readable time/distance
-            is_field = any(f in r['event'].lower() for f in ['jump', 'vault', 'put', 'throw', 'discus', 'hammer', 'javelin'])
-            if is_field:
-                row['NCAA Std'] = f"{ncaa_standard:.2f}m"
-            else:
-                row['NCAA Std'] = format_standard_time(ncaa_standard)
-
-            # Format the difference as percentage
-            # Negative = qualified (under standard for time, over for field)
-            if ncaa_diff_pct is not None:
-                if is_field:
-                    # Field: positive % = over standard (good/qualified)
-                    # Flip sign so negative = not qualified, positive = qualified
-                    display_pct = ncaa_diff_pct
-                    if display_pct >= 0:
-                        row['vs NCAA'] = f"+{display_pct:.1f}%"
-                    else:
-                        row['vs NCAA'] = f"{display_pct:.1f}%"
-                else:
-                    # Time: negative % = under standard (qualified)
-                    if ncaa_diff_pct <= 0:
-                        row['vs NCAA'] = f"{ncaa_diff_pct:.1f}%"
-                    else:
-                        row['vs NCAA'] = f"+{ncaa_diff_pct:.1f}%"
-            else:
-                row['vs NCAA'] = '-'
-        else:
-            row['NCAA Std'] = '-'
-            row['vs NCAA'] = '-'
-
-        # GLVC Conference Ranking columns
-        glvc_rank = r.get('glvc_rank')
-        glvc_sec_ahead = r.get('glvc_sec_ahead')
-        glvc_sec_behind = r.get('glvc_sec_behind')
-        is_field = r.get('glvc_is_field', False)
-
-        if glvc_rank is not None:
-            # Athlete is ranked in GLVC (top 16)
-            row['GLVC Rank'] = str(glvc_rank)
-            row['Sec Ahead'] = format_gap(glvc_sec_ahead, is_field) if glvc_sec_ahead is not None else '-'
-            row['Sec Behind'] = format_gap(glvc_sec_behind, is_field) if glvc_sec_behind is not None else '-'
-        else:
-            # Not ranked (NR) - show gap to qualifying (16th place)
-            row['GLVC Rank'] = 'NR'
-            row['Sec Ahead'] = '-'
-            # For unranked, sec_behind shows gap to 16th place (qualifying)
-            if glvc_sec_behind is not None:
-                row['Sec Behind'] = f"+{format_gap(glvc_sec_behind, is_field)}"
-            else:
-                row['Sec Behind'] = '-'
-
-        data.append(row)
+    data = list(map(_build_result_row, sorted_results))
 
-    df = pd.DataFrame(data)
     columns = ['Name', 'Type', 'Sport', 'Event', 'Time/Mark', 'Place', 'Date', 'Meet', 'Previous Best', 'PR Date', 'Previous SR', 'SR Date', '% from PR', '% from SR', 'NCAA Std', 'vs NCAA', 'GLVC Rank', 'Sec Ahead', 'Sec Behind']
-    df = df[columns]
 
     # Build filename with sport(s) and date range
     sport_abbrevs = {'xc': 'XC', 'indoor': 'Indoor', 'outdoor': 'Outdoor'}
@@ -3026,7 +3284,7 @@ def main():
     start_str = cutoff_date.strftime('%b%d')
     end_str = end_date.strftime('%b%d')
     base_filename = f"results_{sports_str}_{start_str}-{end_str}"
-    filepath = f"{output_dir}/{base_filename}.xlsx"
+    filepath = os.path.join(output_dir, f"{base_filename}.xlsx")
 
     # Try to save, overwriting any existing file
     # Export to JSON first (important for cloud mode)
@@ -3041,7 +3299,7 @@ def main():
         if os.path.exists(filepath):
             with open(filepath, 'a'):
                 pass  # Just checking if file is locked
-        _save_styled_excel(df, filepath, sorted_results)
+        _save_styled_excel(data, columns, filepath)
         print(f"\nResults saved to: {filepath}")
     except (PermissionError, OSError) as e:
         if not args.cloud:
@@ -3052,11 +3310,11 @@ def main():
         else:
             print(f"\nSkipping Excel save in cloud mode")
 
-    print(f"  PRs: {len(prs)}")
-    print(f"  SRs: {len(srs)}")
-    print(f"  First Times: {len(fts)}")
-    print(f"  Other Results: {len(others)}")
-    print(f"  DNS/DNF: {len(dns_dnf)}")
+    print(f"  PRs: {group_counts[GROUP_PR]}")
+    print(f"  SRs: {group_counts[GROUP_SR]}")
+    print(f"  First Times: {group_counts[GROUP_FT]}")
+    print(f"  Other Results: {group_counts[GROUP_OTHER]}")
+    print(f"  DNS/DNF: {group_counts[GROUP_DNS_DNF]}")
 
     print("\n" + "=" * 70)
     print("SUCCESS! Check the spreadsheet for results.")
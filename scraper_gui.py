@@ -8,12 +8,61 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import subprocess
 import threading
+import codecs
+from collections import deque
+import io
+import locale
 import os
 import re
 import sys
 
 
+# ===== Progress Line Patterns =====
+# Athlete progress lines look like "[N] Athlete Name"; summary lines like "Found N total results"
+_ATHLETE_PROGRESS_RE = re.compile(r'\[(\d+)\]\s*(.*)')
+_FOUND_COUNT_RE = re.compile(r'Found (\d+)')
+
+# Fixed stage lines: output prefix -> (percent, status)
+_PROGRESS_STAGES = {
+    "Starting browser": (2, "Starting browser..."),
+    "Checking ChromeDriver": (4, "Checking ChromeDriver..."),
+    "Launching Chrome": (8, "Launching Chrome..."),
+    "Loading team page": (12, "Loading team page..."),
+    "Capturing API tokens": (16, "Capturing API tokens..."),
+    "API tokens captured": (18, "API ready!"),
+    "Results saved to": (95, "Saving spreadsheet..."),
+    "SUCCESS": (100, "Complete!"),
+}
+_STAGE_PREFIXES = tuple(_PROGRESS_STAGES)
+
+PIPE_READ_SIZE = 65536
+ERROR_TAIL_CHARS = 500  # how much trailing output an error dialog shows
+ERROR_TAIL_LINES = 40   # output lines kept to build that tail
+
+
+def iter_output_lines(pipe):
+    """
+    Yield lines from a binary subprocess pipe.
+    Reads whatever is available in one os.read per burst (instead of a read per
+    line) and decodes incrementally with universal newlines, as text mode did.
+    """
+    fd = pipe.fileno()
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(locale.getpreferredencoding(False))(), translate=True)
+    pending = ''
+    while True:
+        chunk = os.read(fd, PIPE_READ_SIZE)
+        *lines, pending = (pending + decoder.decode(chunk, final=not chunk)).split('\n')
+        yield from lines
+        if not chunk:
+            break
+    if pending:
+        yield pending
+
+
 class ScraperGUI:
+    PROGRESS_POLL_MS = 50  # ~20 progress redraws per second at most
+
     def __init__(self, root):
         self.root = root
         self.root.title("UIS Athletics Scraper")
@@ -28,6 +77,12 @@ class ScraperGUI:
 
         self.create_widgets()
 
+        # Latest (percent, status) posted by the worker thread; the Tk side
+        # polls it so bursts of output collapse into one update per tick
+        self._latest_progress = None
+        self._latest_lock = threading.Lock()
+        self.root.after(self.PROGRESS_POLL_MS, self._poll_progress)
+
     def create_widgets(self):
         # Main frame with padding
         main_frame = ttk.Frame(self.root, padding="20")
@@ -85,6 +140,10 @@ class ScraperGUI:
                                        foreground="gray")
         self.status_label.pack()
 
+        # Last values written to the Tk variables (every write goes through update_progress)
+        self._last_percent = 0
+        self._last_status = "Ready"
+
         # Run button
         self.run_button = ttk.Button(main_frame, text="Run Scraper",
                                       command=self.run_scraper)
@@ -115,8 +174,7 @@ class ScraperGUI:
         cmd.append("--desktop")
 
         # Reset progress
-        self.progress_var.set(0)
-        self.status_var.set("Starting...")
+        self.update_progress(0, "Starting...")
 
         # Disable button
         self.run_button.config(state=tk.DISABLED)
@@ -135,18 +193,24 @@ class ScraperGUI:
                 cmd,
                 cwd=script_dir,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                stderr=subprocess.STDOUT
             )
 
-            output_lines = []
+            # Track outcome flags as lines stream in, keeping only the last
+            # few lines for the error message
+            saw_success = False
+            saw_no_results = False
+            tail = deque(maxlen=ERROR_TAIL_LINES)
             filepath = None
 
             # Read output line by line
-            for line in process.stdout:
+            for line in iter_output_lines(process.stdout):
                 line = line.strip()
-                output_lines.append(line)
+                tail.append(line)
+                if "SUCCESS" in line:
+                    saw_success = True
+                if "No results found" in line:
+                    saw_no_results = True
 
                 # Parse progress updates
                 self.parse_progress(line)
@@ -158,14 +222,13 @@ class ScraperGUI:
             process.wait()
 
             # Check result
-            full_output = '\n'.join(output_lines)
-
-            if "SUCCESS" in full_output or filepath:
+            if saw_success or filepath:
                 self.root.after(0, lambda: self.on_success(filepath))
-            elif "No results found" in full_output:
+            elif saw_no_results:
                 self.root.after(0, self.on_no_results)
             else:
-                self.root.after(0, lambda: self.on_error(full_output[-500:]))
+                output_tail = '\n'.join(tail)[-ERROR_TAIL_CHARS:]
+                self.root.after(0, lambda: self.on_error(output_tail))
 
         except Exception as e:
             self.root.after(0, lambda: self.on_error(str(e)))
@@ -173,90 +236,83 @@ class ScraperGUI:
     def parse_progress(self, line):
         """Parse scraper output and update progress bar."""
 
-        # Starting browser
-        if "Starting browser" in line:
-            self.root.after(0, lambda: self.update_progress(2, "Starting browser..."))
-
-        # Checking ChromeDriver
-        elif "Checking ChromeDriver" in line:
-            self.root.after(0, lambda: self.update_progress(4, "Checking ChromeDriver..."))
-
-        # Launching Chrome
-        elif "Launching Chrome" in line:
-            self.root.after(0, lambda: self.update_progress(8, "Launching Chrome..."))
-
-        # Loading team page
-        elif "Loading team page" in line:
-            self.root.after(0, lambda: self.update_progress(12, "Loading team page..."))
-
-        # Capturing API tokens
-        elif "Capturing API tokens" in line:
-            self.root.after(0, lambda: self.update_progress(16, "Capturing API tokens..."))
-
-        # API tokens captured
-        elif "API tokens captured" in line:
-            self.root.after(0, lambda: self.update_progress(18, "API ready!"))
+        # Fixed stages (one startswith over all prefixes before finding which)
+        if line.startswith(_STAGE_PREFIXES):
+            for prefix, (pct, status) in _PROGRESS_STAGES.items():
+                if line.startswith(prefix):
+                    self.post_progress(pct, status)
+                    return
 
         # Checking sport
-        elif "Checking" in line and ("Cross Country" in line or "Track & Field" in line):
+        if "Checking" in line and ("Cross Country" in line or "Track & Field" in line):
             sport = line.split("Checking")[-1].split("...")[0].strip()
-            self.root.after(0, lambda s=sport: self.update_progress(20, f"Checking {s}..."))
+            self.post_progress(20, f"Checking {sport}...")
 
         # Checking athletes progress (e.g., "[1] Athlete Name" or "[1/55] Athlete Name")
-        elif re.search(r'\[(\d+)\]', line):
-            # New format: [N] Name (no total, just count of active athletes)
-            match = re.search(r'\[(\d+)\]\s*(.*)', line)
-            if match:
-                current = int(match.group(1))
-                name = match.group(2).strip()
-                # Estimate progress (assume ~30 active athletes typical)
-                pct = min(80, 20 + (current * 2))  # 20-80% range
-                self.root.after(0, lambda p=pct, c=current, n=name:
-                    self.update_progress(p, f"[{c}] {n}"))
+        # New format: [N] Name (no total, just count of active athletes)
+        elif match := _ATHLETE_PROGRESS_RE.search(line):
+            current = int(match.group(1))
+            name = match.group(2).strip()
+            # Estimate progress (assume ~30 active athletes typical)
+            pct = min(80, 20 + (current * 2))  # 20-80% range
+            self.post_progress(pct, f"[{current}] {name}")
 
         # Found results
         elif "Found" in line and ("total results" in line or "results from" in line):
-            match = re.search(r'Found (\d+)', line)
+            match = _FOUND_COUNT_RE.search(line)
             if match:
                 count = match.group(1)
-                self.root.after(0, lambda c=count:
-                    self.update_progress(85, f"Found {c} results, processing..."))
-
-        # Saving
-        elif "Results saved to" in line:
-            self.root.after(0, lambda: self.update_progress(95, "Saving spreadsheet..."))
-
-        # Success
-        elif "SUCCESS" in line:
-            self.root.after(0, lambda: self.update_progress(100, "Complete!"))
+                self.post_progress(85, f"Found {count} results, processing...")
+
+    def post_progress(self, percent, status):
+        """Record the latest progress from the worker thread (applied by the poller)."""
+        with self._latest_lock:
+            self._latest_progress = (percent, status)
+
+    def _take_progress(self):
+        """Atomically take the pending progress update, if any."""
+        with self._latest_lock:
+            latest, self._latest_progress = self._latest_progress, None
+        return latest
+
+    def _poll_progress(self):
+        """Apply the most recent posted progress, then reschedule."""
+        latest = self._take_progress()
+        if latest is not None:
+            self.update_progress(*latest)
+        self.root.after(self.PROGRESS_POLL_MS, self._poll_progress)
 
     def update_progress(self, percent, status):
-        """Update progress bar and status label."""
-        self.progress_var.set(percent)
-        self.status_var.set(status)
+        """Update progress bar and status label, skipping Tk writes that change nothing."""
+        if percent != self._last_percent:
+            self.progress_var.set(percent)
+            self._last_percent = percent
+        if status != self._last_status:
+            self.status_var.set(status)
+            self._last_status = status
 
     def on_success(self, filepath):
+        self._take_progress()  # discard any stale worker update
         self.run_button.config(state=tk.NORMAL)
-        self.progress_var.set(100)
-        self.status_var.set("Complete! Opening results...")
+        self.update_progress(100, "Complete! Opening results...")
 
         if filepath and os.path.exists(filepath):
             subprocess.run(["open", filepath])
-            self.status_var.set("Complete!")
+            self.update_progress(100, "Complete!")
         else:
-            self.status_var.set("Complete! Check Desktop for results.")
+            self.update_progress(100, "Complete! Check Desktop for results.")
 
     def on_no_results(self):
+        self._take_progress()  # discard any stale worker update
         self.run_button.config(state=tk.NORMAL)
-        self.progress_var.set(100)
-        self.status_var.set("No results found.")
+        self.update_progress(100, "No results found.")
         messagebox.showinfo("No Results",
                            "No results were found in the specified time period.")
 
     def on_error(self, error_msg):
+        self._take_progress()  # discard any stale worker update
         self.run_button.config(state=tk.NORMAL)
-        self.progress_var.set(0)
-        self.status_var.set("Error occurred")
+        self.update_progress(0, "Error occurred")
         messagebox.showerror("Error", f"An error occurred:\n\n{error_msg[:500]}")
 
 
@@ -5,10 +5,16 @@ Fetches current GLVC Performance List rankings from TFRRS.
 Used to add conference ranking context to UIS athlete results.
 """
 
+import json
+import os
 import requests
-from bs4 import BeautifulSoup
 import re
-from typing import Dict, List, Optional, Tuple
+import string
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from lxml import etree
 
 
 # URLs for GLVC Performance Lists (2025-26 season)
@@ -20,6 +26,10 @@ TFRRS_GLVC_URLS = {
 # Keep backwards-compatible alias
 TFRRS_GLVC_URL = TFRRS_GLVC_URLS['indoor']
 
+# Parsed lists saved with their ETag/Last-Modified, so reruns can revalidate
+# with a conditional GET and skip downloading and parsing an unchanged list
+LIST_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.uisResults', 'glvc_lists.json')
+
 # Event name mapping: Athletic.net variations -> TFRRS canonical name
 EVENT_NAME_MAP = {
     # Sprints
@@ -96,26 +106,192 @@ EVENT_NAME_MAP = {
 }
 
 # Field events where higher mark is better
-FIELD_EVENTS = {'High Jump', 'Pole Vault', 'Long Jump', 'Triple Jump',
-                'Shot Put', 'Weight Throw', 'Discus', 'Hammer', 'Javelin'}
+FIELD_EVENTS = frozenset({'High Jump', 'Pole Vault', 'Long Jump', 'Triple Jump',
+                          'Shot Put', 'Weight Throw', 'Discus', 'Hammer', 'Javelin'})
 
 # Top N athletes qualify for conference championship
 QUALIFYING_SPOTS = 16
 
+# Performance list page patterns
+_EVENT_SECTION_CLASS_RE = re.compile(r'gender_([mf])\s+standard_event')
+_SECTION_GENDERS = {'m': 'M', 'f': 'W'}
+_GENDER_SUFFIX_RE = re.compile(r'\s*\((Men|Women)\)\s*')
+_TIME_MARK_RE = re.compile(r'^\d+[:.]\d+')
+_FIELD_MARK_RE = re.compile(r'^\d+\.\d+m?$')
+# Trailing mark annotations: '*', '#', and letters such as the 'm' on field marks
+_MARK_SUFFIX_CHARS = '*#' + string.ascii_letters
+
+# Event names to look for in a section's text when it has no header, in priority order
+_FALLBACK_EVENTS = ('60 Meters', '100 Meters', '200 Meters', '400 Meters', '800 Meters',
+                    'Mile', '1500 Meters', '3000 Meters', '5000 Meters', '10000 Meters',
+                    '60 Hurdles', '100 Hurdles', '110 Hurdles', '400 Hurdles',
+                    'Steeplechase', 'High Jump', 'Pole Vault', 'Long Jump', 'Triple Jump',
+                    'Shot Put', 'Discus', 'Hammer Throw', 'Javelin', 'Weight Throw')
+_FALLBACK_EVENT_PRIORITY = {evt: i for i, evt in enumerate(_FALLBACK_EVENTS)}
+# Lookahead alternation: one scan reports every event occurring anywhere, even overlapping
+_FALLBACK_EVENT_RE = re.compile('(?=(' + '|'.join(map(re.escape, _FALLBACK_EVENTS)) + '))')
+
+
+def _bisect_left_descending(marks, x) -> int:
+    """Index of the first mark <= x in a descending sequence (bisect_left for best-first field lists)."""
+    lo, hi = 0, len(marks)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if marks[mid] > x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@lru_cache(maxsize=256)
+def _normalize_event(event: str) -> Tuple[str, bool]:
+    """Map an Athletic.net event name to (TFRRS event name, is_field)."""
+    tfrrs_event = EVENT_NAME_MAP.get(event, event)
+    return tfrrs_event, tfrrs_event in FIELD_EVENTS
+
+
+def load_list_cache() -> Dict[str, dict]:
+    """Load saved lists: url -> {'etag', 'last_modified', 'rankings'}."""
+    try:
+        with open(LIST_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_list_cache(cache: Dict[str, dict]):
+    """Write saved lists (atomically, so a reader never sees a partial file)."""
+    tmp_path = LIST_CACHE_FILE + '.part'
+    try:
+        os.makedirs(os.path.dirname(LIST_CACHE_FILE), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, LIST_CACHE_FILE)
+    except OSError:
+        pass
+
+
+class TFRRSTarget:
+    """
+    lxml parser target that streams a TFRRS performance list without building a tree.
+    Only what _parse_rankings_page needs is kept: for each event section div, its
+    gender ('M'/'W'), the text pieces of its first event header (None if it has
+    none), its text (only while headerless, for the name fallback), and the text
+    of each results link. close() returns the sections in document order.
+    """
+
+    HEADER_TAGS = frozenset({'h3', 'h4', 'div'})
+    SKIPPED_TEXT_TAGS = frozenset({'script', 'style'})
+
+    def __init__(self):
+        self.sections = []
+        self._depth = 0
+        self._open_sections = []   # (depth, section) for each enclosing section
+        self._headers = []         # (depth, text pieces) for headers being read
+        self._link = None          # (depth, text pieces, sections) for the open results link
+        self._skip_depth = 0       # > 0 inside script/style, whose text isn't page text
+        self._buffer = []
+
+    def _flush(self):
+        """Hand text accumulated since the last tag to everything currently reading it."""
+        if not self._buffer:
+            return
+        text = ''.join(self._buffer)
+        self._buffer.clear()
+        if self._skip_depth:
+            return
+
+        for _, section in self._open_sections:
+            if section['text'] is not None:
+                section['text'].append(text)
+
+        # Header and link text are read like get_text(strip=True)
+        stripped = text.strip()
+        if stripped:
+            for _, pieces in self._headers:
+                pieces.append(stripped)
+            if self._link:
+                self._link[1].append(stripped)
+
+    def start(self, tag, attrib):
+        self._flush()
+        self._depth += 1
+        classes = attrib.get('class', '')
+
+        if tag in self.SKIPPED_TEXT_TAGS:
+            self._skip_depth += 1
+
+        # The first matching header inside each enclosing section names its event
+        if tag in self.HEADER_TAGS and ('panel-title' in classes or 'event-title' in classes):
+            for _, section in self._open_sections:
+                if section['header'] is None:
+                    section['header'] = []
+                    section['text'] = None
+                    self._headers.append((self._depth, section['header']))
+
+        # Cheap substring test first; the pattern only runs on likely section divs.
+        # The gender_[mf] class that identifies a section also gives its gender.
+        match = tag == 'div' and 'standard_event' in classes and _EVENT_SECTION_CLASS_RE.search(classes)
+        if match:
+            section = {'gender': _SECTION_GENDERS[match.group(1)], 'header': None, 'text': [], 'links': []}
+            self.sections.append(section)
+            self._open_sections.append((self._depth, section))
+
+        if tag == 'a' and self._link is None and self._open_sections \
+                and '/results/' in attrib.get('href', ''):
+            self._link = (self._depth, [], [section for _, section in self._open_sections])
+
+    def end(self, tag):
+        self._flush()
+        depth = self._depth
+        self._depth -= 1
+
+        if tag in self.SKIPPED_TEXT_TAGS:
+            self._skip_depth -= 1
+
+        if self._link and self._link[0] == depth:
+            _, pieces, sections = self._link
+            text = ''.join(pieces)
+            for section in sections:
+                section['links'].append(text)
+            self._link = None
+
+        while self._headers and self._headers[-1][0] == depth:
+            self._headers.pop()
+        while self._open_sections and self._open_sections[-1][0] == depth:
+            self._open_sections.pop()
+
+    def data(self, data):
+        self._buffer.append(data)
+
+    def comment(self, text):
+        # Comments aren't page text, but they do separate the strings around them
+        self._flush()
+
+    def close(self):
+        self._flush()
+        return self.sections
+
 
 class GLVCRankings:
     """
     Fetches and caches GLVC rankings from TFRRS.
     Instantiate once per scraper run, call fetch_rankings() first.
+    Pass an existing session to reuse its pooled TFRRS connection across instances.
     """
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
-        # Cache: key = "{event}_{gender}" e.g. "Mile_M", value = list of mark values (sorted)
-        self._rankings_cache: Dict[str, List[float]] = {}
+    def __init__(self, session: Optional[requests.Session] = None):
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            })
+        self.session = session
+        # Cache: key = (event, gender) e.g. ("Mile", "M"), value = sorted array('d') of mark values
+        self._rankings_cache: Dict[Tuple[str, str], array] = {}
+        # Lowercased (event, gender) -> actual key, for case-insensitive event lookups
+        self._rankings_ci_index: Dict[Tuple[str, str], Tuple[str, str]] = {}
         self._fetched = False
 
     def fetch_rankings(self, season='indoor') -> bool:
@@ -130,9 +306,32 @@ class GLVCRankings:
         label = season.capitalize()
         try:
             print(f"  Fetching GLVC {label} Performance List from TFRRS...")
-            resp = self.session.get(url, timeout=30)
-            resp.raise_for_status()
-            self._parse_rankings_page(resp.text)
+            list_cache = load_list_cache()
+            saved = list_cache.get(url)
+
+            # Revalidate the saved copy; a 304 means the list hasn't changed
+            headers = {}
+            if saved:
+                if saved.get('etag'):
+                    headers['If-None-Match'] = saved['etag']
+                if saved.get('last_modified'):
+                    headers['If-Modified-Since'] = saved['last_modified']
+
+            resp = self.session.get(url, headers=headers, timeout=30)
+            if resp.status_code == 304 and saved:
+                print(f"  {label} list unchanged since last run, using saved rankings")
+                self._add_rankings({(event, gender): array('d', marks)
+                                    for event, gender, marks in saved['rankings']})
+            else:
+                resp.raise_for_status()
+                page_rankings = self._parse_rankings_page(resp.text)
+                etag = resp.headers.get('ETag')
+                last_modified = resp.headers.get('Last-Modified')
+                if etag or last_modified:
+                    list_cache[url] = {'etag': etag, 'last_modified': last_modified,
+                                       'rankings': [[event, gender, marks.tolist()] for (event, gender), marks
+                                                    in page_rankings.items()]}
+                    save_list_cache(list_cache)
             self._fetched = True
             print(f"  Loaded rankings for {len(self._rankings_cache)} event/gender combinations")
             return True
@@ -140,48 +339,30 @@ class GLVCRankings:
             print(f"  Warning: Could not fetch GLVC rankings: {e}")
             return False
 
-    def _parse_rankings_page(self, html: str):
-        """Parse the TFRRS page and extract rankings by event/gender."""
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Find all event sections - they have class pattern "gender_X standard_event_hnd_##"
-        event_sections = soup.find_all('div', class_=re.compile(r'gender_[mf]\s+standard_event'))
-
-        for section in event_sections:
-            # Determine gender from class
-            classes = section.get('class', [])
-            gender = None
-            for cls in classes:
-                if 'gender_m' in cls:
-                    gender = 'M'
-                    break
-                elif 'gender_f' in cls:
-                    gender = 'W'
-                    break
-
-            if not gender:
-                continue
+    def _parse_rankings_page(self, html: str) -> Dict[Tuple[str, str], array]:
+        """Parse the TFRRS page and extract rankings by event/gender (returns this page's)."""
+        page_rankings = {}
+        # Stream the page through TFRRSTarget rather than building a full tree
+        parser = etree.HTMLParser(target=TFRRSTarget())
+        parser.feed(html)
 
-            # Find event name - it's in a div with class containing the event name
+        # Event sections are divs with class pattern "gender_X standard_event_hnd_##"
+        for section in parser.close():
+            gender = section['gender']
+
+            # Find event name - it's in a header with class panel-title/event-title
             # Look for text like "60 Meters", "Mile", "800 Meters", etc.
             event_name = None
-            header = section.find(['h3', 'h4', 'div'], class_=re.compile(r'panel-title|event-title'))
-            if header:
-                text = header.get_text(strip=True)
+            if section['header'] is not None:
+                text = ''.join(section['header'])
                 # Extract event name (remove "(Men)" or "(Women)")
-                text = re.sub(r'\s*\((Men|Women)\)\s*', '', text).strip()
+                text = _GENDER_SUFFIX_RE.sub('', text).strip()
                 event_name = text
             else:
-                # Try to find event name from the section text
-                section_text = section.get_text()
-                for evt in ['60 Meters', '100 Meters', '200 Meters', '400 Meters', '800 Meters',
-                           'Mile', '1500 Meters', '3000 Meters', '5000 Meters', '10000 Meters',
-                           '60 Hurdles', '100 Hurdles', '110 Hurdles', '400 Hurdles',
-                           'Steeplechase', 'High Jump', 'Pole Vault', 'Long Jump', 'Triple Jump',
-                           'Shot Put', 'Discus', 'Hammer Throw', 'Javelin', 'Weight Throw']:
-                    if evt in section_text:
-                        event_name = evt
-                        break
+                # Try to find event name from the section text (highest-priority match)
+                found = _FALLBACK_EVENT_RE.findall(''.join(section['text']))
+                if found:
+                    event_name = min(found, key=_FALLBACK_EVENT_PRIORITY.__getitem__)
 
             if not event_name:
                 continue
@@ -189,20 +370,32 @@ class GLVCRankings:
             # Extract performance marks from links
             # Times are in <a> tags that link to results pages
             marks = []
-            for link in section.find_all('a', href=re.compile(r'/results/')):
-                text = link.get_text(strip=True)
+            for text in section['links']:
                 # Check if this looks like a time or mark
-                if re.match(r'^\d+[:.]\d+', text) or re.match(r'^\d+\.\d+m?$', text):
+                if _TIME_MARK_RE.match(text) or _FIELD_MARK_RE.match(text):
                     mark_value = self._parse_mark_to_value(text, event_name in FIELD_EVENTS)
                     if mark_value and mark_value != float('inf'):
                         marks.append(mark_value)
 
             if marks:
-                cache_key = f"{event_name}_{gender}"
+                cache_key = (event_name, gender)
                 # Sort: lower is better for time, higher for field
                 is_field = event_name in FIELD_EVENTS
                 marks.sort(reverse=is_field)
-                self._rankings_cache[cache_key] = marks
+                # Stored packed as C doubles: 8 bytes a mark instead of a float object each
+                page_rankings[cache_key] = array('d', marks)
+
+        self._add_rankings(page_rankings)
+        return page_rankings
+
+    def _add_rankings(self, rankings: Dict[Tuple[str, str], array]):
+        """Merge parsed rankings into the cache and refresh the case-insensitive index."""
+        self._rankings_cache.update(rankings)
+
+        # First key wins when two differ only by case
+        self._rankings_ci_index = {}
+        for key in self._rankings_cache:
+            self._rankings_ci_index.setdefault((key[0].lower(), key[1].lower()), key)
 
     def _parse_mark_to_value(self, mark_str: str, is_field: bool) -> Optional[float]:
         """
@@ -214,9 +407,8 @@ class GLVCRankings:
             return None
 
         # Clean the string
-        mark_str = mark_str.strip()
-        mark_str = re.sub(r'[*#a-zA-Z]+$', '', mark_str)  # Remove trailing letters/symbols
-        mark_str = mark_str.replace('m', '')  # Remove 'm' suffix from field events
+        mark_str = mark_str.strip().rstrip(_MARK_SUFFIX_CHARS)  # Remove trailing letters/symbols
+        mark_str = mark_str.replace('m', '')  # Remove any 'm' left inside the mark
 
         try:
             if ':' in mark_str:
@@ -252,42 +444,26 @@ class GLVCRankings:
             return None, None, None
 
         # Normalize event name
-        tfrrs_event = EVENT_NAME_MAP.get(event, event)
-        cache_key = f"{tfrrs_event}_{gender}"
+        tfrrs_event, is_field = _normalize_event(event)
+        cache_key = (tfrrs_event, gender)
 
         if cache_key not in self._rankings_cache:
             # Try case-insensitive match
-            for key in self._rankings_cache:
-                if key.lower() == cache_key.lower():
-                    cache_key = key
-                    break
-            else:
+            cache_key = self._rankings_ci_index.get((tfrrs_event.lower(), gender.lower()))
+            if cache_key is None:
                 return None, None, None
 
         rankings = self._rankings_cache[cache_key]
         if not rankings:
             return None, None, None
 
-        is_field = tfrrs_event in FIELD_EVENTS
-
-        # Find where this athlete would rank
-        # Rankings are already sorted (best first)
-        rank = None
-        for i, mark in enumerate(rankings):
-            if is_field:
-                # Field: athlete beats this mark if their mark is higher or equal
-                if athlete_mark >= mark:
-                    rank = i + 1
-                    break
-            else:
-                # Time: athlete beats this mark if their time is lower or equal
-                if athlete_mark <= mark:
-                    rank = i + 1
-                    break
-
-        if rank is None:
-            # Athlete didn't beat anyone in the list
-            rank = len(rankings) + 1
+        # Find where this athlete would rank: binary search for the first mark
+        # they match or beat. Rankings are already sorted (best first): ascending
+        # for times, descending for field marks. Beating nobody gives len + 1.
+        if is_field:
+            rank = _bisect_left_descending(rankings, athlete_mark) + 1
+        else:
+            rank = bisect_left(rankings, athlete_mark) + 1
 
         # Calculate gaps
         gap_ahead = None  # Gap to person ranked below (who they're ahead of)
@@ -326,8 +502,7 @@ class GLVCRankings:
 
     def is_field_event(self, event: str) -> bool:
         """Check if an event is a field event (higher is better)."""
-        tfrrs_event = EVENT_NAME_MAP.get(event, event)
-        return tfrrs_event in FIELD_EVENTS
+        return _normalize_event(event)[1]
 
 
 def format_gap(gap: Optional[float], is_field: bool) -> str:
@@ -347,7 +522,7 @@ def format_gap(gap: Optional[float], is_field: bool) -> str:
 if __name__ == "__main__":
     glvc = GLVCRankings()
     if glvc.fetch_rankings():
-        print(f"\nLoaded events: {list(glvc._rankings_cache.keys())}")
+        print(f"\nLoaded events: {[f'{event} ({gender})' for event, gender in glvc._rankings_cache]}")
 
         print("\nTesting rankings lookup:")
         # Test Mile for men (4:10 = 250 seconds)